@@ -4,9 +4,12 @@ Force Publish - Manual override to publish specific items
 Bypasses score filters and seen state to force-post items to Telegram
 """
 
+import heapq
 import json
 import os
+import re
 import asyncio
+import contextlib
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
@@ -18,6 +21,23 @@ except ImportError:
     print("❌ telegram module not found. Install: pip install python-telegram-bot")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Minimum spacing between messages to the same chat
+SEND_INTERVAL_SECONDS = 1.0
+
+# Markup stripped from the dry-run preview; '">' closes the href and becomes a space
+_PREVIEW_MARKUP_RE = re.compile(r'</?[bi]>|<a href="|">|</a>')
+
+def _read_json(path: Path):
+    """Parse a JSON file, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding='utf-8'))
+
 def load_items() -> List[Dict]:
     """Load all items from items_last24h.json"""
     items_path = Path('out/items_last24h.json')
@@ -26,44 +46,71 @@ def load_items() -> List[Dict]:
         print("Run 'python run.py' first to fetch news")
         sys.exit(1)
 
-    return json.loads(items_path.read_text())
+    return _read_json(items_path)
 
 def load_state() -> Dict:
-    """Load seen state"""
+    """Load seen state.
+
+    'seen' is held as an insertion-ordered dict in memory (and '_title_ids'
+    indexes the ids in 'seen_titles') so membership checks are O(1);
+    save_state() converts back to the on-disk list form, new ids last.
+    """
     state_path = Path('state/seen_alerts.json')
-    if state_path.exists():
-        return json.loads(state_path.read_text())
-    return {'seen': [], 'seen_titles': []}
+    state = _read_json(state_path) if state_path.exists() else {}
+    seen_titles = state.get('seen_titles', [])
+    state['seen'] = dict.fromkeys(state.get('seen', []))
+    state['seen_titles'] = seen_titles
+    state['_title_ids'] = {t.get('id') for t in seen_titles}
+    return state
 
 def save_state(state: Dict):
     """Save updated state"""
     state_path = Path('state/seen_alerts.json')
-    state_path.write_text(json.dumps(state, indent=2))
+    out = {k: v for k, v in state.items() if not k.startswith('_')}
+    out['seen'] = list(state['seen'])
+    if orjson is not None:
+        state_path.write_bytes(orjson.dumps(out, option=orjson.OPT_INDENT_2))
+    else:
+        state_path.write_text(json.dumps(out, indent=2))
 
 def find_items_by_ids(items: List[Dict], item_ids: List[str]) -> List[Dict]:
     """Find items matching the given IDs"""
-    # Support both full IDs and partial IDs (first 16 chars)
-    found = []
+    # Support both full IDs and partial IDs (first 16 chars).
+    # Full IDs and 16-char prefixes are dict lookups; any other prefix
+    # length falls back to a linear startswith scan.
+    by_id: Dict[str, List[Dict]] = {}
+    by_prefix16: Dict[str, List[Dict]] = {}
     for item in items:
         item_id = item.get('id', '')
-        for search_id in item_ids:
-            if item_id == search_id or item_id.startswith(search_id):
-                found.append(item)
-                break
+        by_id.setdefault(item_id, []).append(item)
+        by_prefix16.setdefault(item_id[:16], []).append(item)
+
+    matched = set()
+    for search_id in item_ids:
+        if search_id in by_id:
+            hits = by_id[search_id]
+        elif len(search_id) == 16:
+            hits = by_prefix16.get(search_id, [])
+        else:
+            hits = [item for item in items if item.get('id', '').startswith(search_id)]
+        matched.update(id(item) for item in hits)
 
-    return found
+    # Keep the original item order
+    return [item for item in items if id(item) in matched]
 
 def find_items_by_indices(items: List[Dict], indices: List[int]) -> List[Dict]:
     """Find items by their index numbers (1-based, sorted by score)"""
-    # Sort items by score (matching view_all_items.py default)
-    sorted_items = sorted(items, key=lambda x: x.get('score', 0), reverse=True)
+    # Rank items by score (matching view_all_items.py default). Only the
+    # top max(indices) are needed, so a bounded heap replaces a full sort.
+    k = min(max(indices, default=0), len(items))
+    top_items = heapq.nlargest(k, items, key=lambda x: x.get('score', 0))
 
     found = []
     for idx in indices:
-        if 1 <= idx <= len(sorted_items):
-            found.append(sorted_items[idx - 1])
+        if 1 <= idx <= k:
+            found.append(top_items[idx - 1])
         else:
-            print(f"⚠️  Index {idx} out of range (1-{len(sorted_items)})")
+            print(f"⚠️  Index {idx} out of range (1-{len(items)})")
 
     return found
 
@@ -107,63 +154,72 @@ async def post_to_telegram(items: List[Dict], dry_run: bool = False):
 
     bot = Bot(token=token)
 
+    # Telegram allows ~1 message/sec per chat. Space send *starts* one
+    # interval apart rather than sleeping a full second after each send,
+    # so the request round-trip counts toward the interval.
+    loop = asyncio.get_running_loop()
+    next_send_at = loop.time()
+
     print(f"\n{'='*80}")
     print(f"📤 {'DRY RUN - ' if dry_run else ''}Posting {len(items)} item(s) to Telegram")
     print(f"{'='*80}\n")
 
-    for i, item in enumerate(items, 1):
-        title = item.get('title', 'Untitled')
-        score = item.get('score', 0)
-        url = item.get('url', '')
-
-        print(f"[{i}/{len(items)}] {title[:60]}...")
-        print(f"  Score: {score} | URL: {url[:60]}...")
-
-        message = create_alert_message(item)
-
-        if dry_run:
-            print("  🔍 DRY RUN - Message preview:")
-            print("  " + "-"*76)
-            # Show plain text version
-            plain = message.replace('<b>', '').replace('</b>', '')
-            plain = plain.replace('<i>', '').replace('</i>', '')
-            plain = plain.replace('<a href="', '').replace('">', ' ').replace('</a>', '')
-            for line in plain.split('\n'):
-                print(f"  {line}")
-            print("  " + "-"*76)
-        else:
-            try:
-                await bot.send_message(
-                    chat_id=chat_id,
-                    text=message,
-                    parse_mode='HTML',
-                    disable_web_page_preview=True
-                )
-                print("  ✅ Posted successfully")
-                await asyncio.sleep(1)  # Rate limiting
-            except Exception as e:
-                print(f"  ❌ Failed to post: {e}")
-
-        print()
+    # Initialise once and keep the bot's HTTP client open for the whole
+    # batch; dry runs never touch the network.
+    async with (contextlib.nullcontext() if dry_run else bot):
+        for i, item in enumerate(items, 1):
+            title = item.get('title', 'Untitled')
+            score = item.get('score', 0)
+            url = item.get('url', '')
+
+            print(f"[{i}/{len(items)}] {title[:60]}...")
+            print(f"  Score: {score} | URL: {url[:60]}...")
+
+            message = create_alert_message(item)
+
+            if dry_run:
+                print("  🔍 DRY RUN - Message preview:")
+                print("  " + "-"*76)
+                # Show plain text version
+                plain = _PREVIEW_MARKUP_RE.sub(lambda m: ' ' if m.group() == '">' else '', message)
+                for line in plain.split('\n'):
+                    print(f"  {line}")
+                print("  " + "-"*76)
+            else:
+                delay = next_send_at - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)  # Rate limiting
+                next_send_at = loop.time() + SEND_INTERVAL_SECONDS
+                try:
+                    await bot.send_message(
+                        chat_id=chat_id,
+                        text=message,
+                        parse_mode='HTML',
+                        disable_web_page_preview=True
+                    )
+                    print("  ✅ Posted successfully")
+                except Exception as e:
+                    print(f"  ❌ Failed to post: {e}")
+
+            print()
 
 def mark_as_seen(items: List[Dict]):
     """Mark items as seen in state file"""
     state = load_state()
 
-    for item in items:
-        item_id = item.get('id')
-        title = item.get('title', '')
-
-        if item_id not in state['seen']:
-            state['seen'].append(item_id)
-
-        # Add to seen_titles if not exists
-        if not any(t.get('id') == item_id for t in state['seen_titles']):
-            state['seen_titles'].append({
-                'id': item_id,
-                'title': title,
-                'seen_at': datetime.now().isoformat()
-            })
+    titles = {item.get('id'): item.get('title', '') for item in items}
+    state['seen'].update(dict.fromkeys(titles))
+
+    # Add to seen_titles if not exists (keeping input order)
+    new_title_ids = titles.keys() - state['_title_ids']
+    if new_title_ids:
+        seen_at = datetime.now().isoformat()
+        state['seen_titles'].extend(
+            {'id': item_id, 'title': title, 'seen_at': seen_at}
+            for item_id, title in titles.items()
+            if item_id in new_title_ids
+        )
+        state['_title_ids'].update(new_title_ids)
 
     save_state(state)
     print(f"✅ Marked {len(items)} item(s) as seen in state file")
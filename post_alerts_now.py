@@ -21,12 +21,24 @@ try:
 except ImportError:
     _requests = None  # type: ignore[assignment]
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _read_json(path: Path):
+    """Parse a JSON file, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
 
 def _load_config() -> dict:
     """Load config.json from repo root."""
     config_path = Path(__file__).resolve().parent / "config.json"
     if config_path.exists():
-        return json.loads(config_path.read_text(encoding="utf-8"))
+        return _read_json(config_path)
     return {}
 
 
@@ -127,7 +139,7 @@ async def post_drafts():
         print("❌ No alerts_drafts.json found")
         sys.exit(1)
 
-    drafts = json.loads(drafts_path.read_text())
+    drafts = _read_json(drafts_path)
 
     if not drafts:
         print("📭 No alerts to post")
@@ -140,65 +152,68 @@ async def post_drafts():
     bot = Bot(token=token)
     feed_entries = []
 
-    for i, draft in enumerate(drafts, 1):
-        message = draft.get('message_html', '')
-        title = draft.get('title', '')
-
-        if not message:
-            print(f"⚠️  Skipping {i}/{len(drafts)}: No message HTML")
-            continue
-
-        try:
-            result_msg = await bot.send_message(
-                chat_id=chat_id,
-                text=message,
-                parse_mode='HTML',
-                disable_web_page_preview=True
-            )
-            msg_id = result_msg.message_id
-            posted_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-            print(f"✅ {i}/{len(drafts)}: {title[:70]}...")
-
-            # Post AI trade analysis as a reply (if enabled)
-            if analysis_on_telegram:
-                article_link = draft.get("link", "")
-                analysis_text = _fetch_trade_analysis(article_link)
-                if analysis_text:
-                    try:
-                        await bot.send_message(
-                            chat_id=chat_id,
-                            text=analysis_text,
-                            parse_mode='HTML',
-                            disable_web_page_preview=True,
-                            reply_to_message_id=msg_id,
-                        )
-                        print(f"  📊 Analysis reply posted")
-                    except Exception as e:
-                        print(f"  ⚠️  Analysis reply failed: {e}")
-
-            feed_entries.append({
-                "id": draft.get("id", ""),
-                "title": title,
-                "link": draft.get("link", ""),
-                "snippet": draft.get("snippet", ""),
-                "score": draft.get("score", 0),
-                "matched_topics": draft.get("matched_topics", []),
-                "ai_category": draft.get("ai_category", ""),
-                "ai_priority": draft.get("ai_priority", ""),
-                "posted_at": posted_at,
-                "source": draft.get("source", ""),
-                "feed_name": draft.get("feed_name", ""),
-                "published_at": draft.get("published_at", ""),
-                "posted_to_telegram": True,
-                "telegram_message_id": msg_id,
-                "posted_to_x": False,
-                "tweet_id": None,
-                "tweet_text": None,
-                "tweet_url": None,
-            })
-        except Exception as e:
-            print(f"❌ {i}/{len(drafts)}: Failed - {e}")
-            print(f"   Title: {title[:70]}...")
+    # Initialise once and keep the bot's HTTP client open for the whole
+    # batch, so every send reuses the same pooled connection.
+    async with bot:
+        for i, draft in enumerate(drafts, 1):
+            message = draft.get('message_html', '')
+            title = draft.get('title', '')
+
+            if not message:
+                print(f"⚠️  Skipping {i}/{len(drafts)}: No message HTML")
+                continue
+
+            try:
+                result_msg = await bot.send_message(
+                    chat_id=chat_id,
+                    text=message,
+                    parse_mode='HTML',
+                    disable_web_page_preview=True
+                )
+                msg_id = result_msg.message_id
+                posted_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+                print(f"✅ {i}/{len(drafts)}: {title[:70]}...")
+
+                # Post AI trade analysis as a reply (if enabled)
+                if analysis_on_telegram:
+                    article_link = draft.get("link", "")
+                    analysis_text = _fetch_trade_analysis(article_link)
+                    if analysis_text:
+                        try:
+                            await bot.send_message(
+                                chat_id=chat_id,
+                                text=analysis_text,
+                                parse_mode='HTML',
+                                disable_web_page_preview=True,
+                                reply_to_message_id=msg_id,
+                            )
+                            print(f"  📊 Analysis reply posted")
+                        except Exception as e:
+                            print(f"  ⚠️  Analysis reply failed: {e}")
+
+                feed_entries.append({
+                    "id": draft.get("id", ""),
+                    "title": title,
+                    "link": draft.get("link", ""),
+                    "snippet": draft.get("snippet", ""),
+                    "score": draft.get("score", 0),
+                    "matched_topics": draft.get("matched_topics", []),
+                    "ai_category": draft.get("ai_category", ""),
+                    "ai_priority": draft.get("ai_priority", ""),
+                    "posted_at": posted_at,
+                    "source": draft.get("source", ""),
+                    "feed_name": draft.get("feed_name", ""),
+                    "published_at": draft.get("published_at", ""),
+                    "posted_to_telegram": True,
+                    "telegram_message_id": msg_id,
+                    "posted_to_x": False,
+                    "tweet_id": None,
+                    "tweet_text": None,
+                    "tweet_url": None,
+                })
+            except Exception as e:
+                print(f"❌ {i}/{len(drafts)}: Failed - {e}")
+                print(f"   Title: {title[:70]}...")
 
     # Write feed entries (TG-only at this point; X script will upsert tweet data)
     if feed_entries:
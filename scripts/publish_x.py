@@ -9,10 +9,14 @@ Features:
   - Ranking agent integration: uses post_to_x flag from run_alerts.py
   - Dry-run mode: test everything without posting
 """
+import functools
+import html
 import os
 import sys
 import json
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -81,6 +85,11 @@ COMPANY_HANDLES = {
     "tether": "@Tether_to",
 }
 
+# Shared HTTP session: consecutive calls to the same host (api.twitter.com,
+# upload.twitter.com, the frontend) reuse a kept-alive TLS connection.
+# Serial calls only; the OG prefetch threads each build their own session.
+_SESSION = requests.Session()
+
 # ===========================================================================
 # Environment + config helpers
 # ===========================================================================
@@ -112,13 +121,20 @@ def _load_config() -> dict:
 # Twitter API v2 posting
 # ===========================================================================
 
+@functools.lru_cache(maxsize=None)
+def _oauth1(api_key: str, api_secret: str, access_token: str, access_secret: str):
+    """Build the OAuth 1.0a signer once per credential set and reuse it."""
+    from requests_oauthlib import OAuth1
+    return OAuth1(api_key, api_secret, access_token, access_secret)
+
+
 def _post_to_x(text: str, api_key: str, api_secret: str,
                access_token: str, access_secret: str,
                media_ids: list[str] = None,
                reply_to_id: str = None) -> dict:
     """Post a tweet using Twitter API v2 with OAuth 1.0a User Context."""
     try:
-        from requests_oauthlib import OAuth1
+        auth = _oauth1(api_key, api_secret, access_token, access_secret)
     except ImportError:
         raise RuntimeError(
             "requests-oauthlib is required for X posting. "
@@ -126,7 +142,6 @@ def _post_to_x(text: str, api_key: str, api_secret: str,
         )
 
     url = "https://api.twitter.com/2/tweets"
-    auth = OAuth1(api_key, api_secret, access_token, access_secret)
     payload = {"text": text}
 
     if media_ids:
@@ -134,7 +149,7 @@ def _post_to_x(text: str, api_key: str, api_secret: str,
     if reply_to_id:
         payload["reply"] = {"in_reply_to_tweet_id": reply_to_id}
 
-    response = requests.post(
+    response = _SESSION.post(
         url, auth=auth, json=payload,
         headers={"Content-Type": "application/json"},
     )
@@ -184,7 +199,7 @@ def _post_analysis_reply(tweet_id: str, article_url: str,
 
     try:
         print(f"  📊 Fetching AI trade analysis...")
-        resp = requests.post(
+        resp = _SESSION.post(
             f"{frontend_url}/api/analyze",
             json={"url": article_url},
             timeout=30,
@@ -270,13 +285,20 @@ def _post_analysis_reply(tweet_id: str, article_url: str,
 # OG image fetching + media upload
 # ===========================================================================
 
-def _fetch_og_image(article_url: str) -> Optional[bytes]:
+# Parallel article fetches when prefetching OG images for a batch
+OG_FETCH_WORKERS = 4
+
+def _fetch_og_image(article_url: str,
+                    session: Optional[requests.Session] = None) -> Optional[bytes]:
     """
     Fetch the og:image from an article URL.
     Returns image bytes or None on failure.
+    Pass a session when calling from a worker thread; _SESSION is used otherwise.
     """
+    if session is None:
+        session = _SESSION
     try:
-        resp = requests.get(article_url, timeout=10, headers={
+        resp = session.get(article_url, timeout=10, headers={
             "User-Agent": "Mozilla/5.0 (compatible; FintechNewsBot/1.0)"
         })
         resp.raise_for_status()
@@ -303,7 +325,7 @@ def _fetch_og_image(article_url: str) -> Optional[bytes]:
             image_url = urljoin(article_url, image_url)
 
         # Download image
-        img_resp = requests.get(image_url, timeout=10, headers={
+        img_resp = session.get(image_url, timeout=10, headers={
             "User-Agent": "Mozilla/5.0 (compatible; FintechNewsBot/1.0)"
         })
         img_resp.raise_for_status()
@@ -320,7 +342,7 @@ def _fetch_og_image(article_url: str) -> Optional[bytes]:
         return img_bytes
 
     except Exception as e:
-        print(f"  ⚠️  OG image fetch failed: {e}")
+        print(f"  ⚠️  OG image fetch failed ({article_url[:80]}): {e}")
         return None
 
 
@@ -331,14 +353,13 @@ def _upload_media(image_bytes: bytes, api_key: str, api_secret: str,
     Returns media_id_string or None on failure.
     """
     try:
-        from requests_oauthlib import OAuth1
+        auth = _oauth1(api_key, api_secret, access_token, access_secret)
     except ImportError:
         return None
 
     url = "https://upload.twitter.com/1.1/media/upload.json"
-    auth = OAuth1(api_key, api_secret, access_token, access_secret)
 
-    response = requests.post(
+    response = _SESSION.post(
         url, auth=auth,
         files={"media_data": ("image.jpg", image_bytes, "application/octet-stream")},
     )
@@ -423,9 +444,12 @@ def _increment_daily_count(posted: int):
 def _post_single(draft: dict, api_key: str, api_secret: str,
                  access_token: str, access_secret: str,
                  config: dict,
-                 dry_run: bool = False) -> tuple[int, Optional[dict]]:
+                 dry_run: bool = False,
+                 og_images: Optional[dict] = None) -> tuple[int, Optional[dict]]:
     """
     Post a single draft to X with OG image.
+    og_images maps link -> prefetched image bytes (or None); when omitted
+    the image is fetched here.
     Returns (posts_made, tweet_metadata_or_None).
     """
     title = draft.get("title", "").strip()
@@ -441,7 +465,7 @@ def _post_single(draft: dict, api_key: str, api_secret: str,
     media_id = None
     img_bytes = None
     if link:
-        img_bytes = _fetch_og_image(link)
+        img_bytes = og_images.get(link) if og_images is not None else _fetch_og_image(link)
         if img_bytes:
             print(f"  🖼️  OG image found ({len(img_bytes) // 1024}KB)")
             if not dry_run:
@@ -600,6 +624,28 @@ def post_from_drafts(drafts_path: str = "out/alerts_drafts.json",
         print(f"⚠️  Limiting to {remaining} posts (daily cap)")
         to_post = to_post[:remaining]
 
+    # Fetch OG images concurrently up front, only for drafts _post_single will
+    # post (it skips untitled ones). Tweets themselves stay serial: they count
+    # against the daily cap and replies need the parent tweet id. Dry runs
+    # upload nothing, so they keep fetching per draft. requests.Session is not
+    # documented as thread-safe, so each worker thread keeps its own session.
+    og_images = None
+    if not dry_run:
+        links = list(dict.fromkeys(
+            d.get("link", "").strip() for d in to_post
+            if d.get("title", "").strip() and d.get("link", "").strip()
+        ))
+        local = threading.local()
+
+        def fetch_og(link):
+            session = getattr(local, "session", None)
+            if session is None:
+                session = local.session = requests.Session()
+            return _fetch_og_image(link, session=session)
+
+        with ThreadPoolExecutor(max_workers=OG_FETCH_WORKERS) as pool:
+            og_images = dict(zip(links, pool.map(fetch_og, links)))
+
     posted_count = 0
     failed_count = 0
     feed_entries = []
@@ -613,7 +659,7 @@ def post_from_drafts(drafts_path: str = "out/alerts_drafts.json",
         try:
             posts, tweet_meta = _post_single(
                 draft, api_key, api_secret, access_token, access_secret,
-                config, dry_run=dry_run,
+                config, dry_run=dry_run, og_images=og_images,
             )
             posted_count += posts
 
@@ -667,30 +713,34 @@ def post_from_drafts(drafts_path: str = "out/alerts_drafts.json",
     print(f"📊 Daily budget remaining: {remaining_after}/{DAILY_POST_LIMIT}")
 
 
+# Patterns for the Telegram HTML embedded in approval issues
+_HTML_FENCE_RE = re.compile(r"```html\s*(.*?)\s*```", re.DOTALL | re.IGNORECASE)
+_TITLE_RE = re.compile(r"<b>(.*?)</b>", re.DOTALL)
+_HREF_RE = re.compile(r'<a\s+href=["\']([^"\']+)["\']')
+
+
 def extract_html_from_issue_body(issue_body: str) -> tuple[Optional[str], Optional[str]]:
     """Extract title and link from GitHub issue body containing Telegram HTML."""
     if not issue_body:
         return None, None
 
-    m = re.search(r"```html\s*(.*?)\s*```", issue_body, flags=re.DOTALL | re.IGNORECASE)
+    m = _HTML_FENCE_RE.search(issue_body)
     if not m:
         return None, None
 
     html_content = m.group(1).strip()
 
-    title_match = re.search(r"<b>(.*?)</b>", html_content, flags=re.DOTALL)
+    title_match = _TITLE_RE.search(html_content)
     if not title_match:
         return None, None
 
-    title = title_match.group(1).strip()
-    title = title.replace("&lt;", "<").replace("&gt;", ">").replace("&amp;", "&")
+    title = html.unescape(title_match.group(1).strip())
 
-    link_match = re.search(r'<a\s+href=["\']([^"\']+)["\']', html_content)
+    link_match = _HREF_RE.search(html_content)
     if not link_match:
         return None, None
 
-    link = link_match.group(1).strip()
-    link = link.replace("&lt;", "<").replace("&gt;", ">").replace("&amp;", "&")
+    link = html.unescape(link_match.group(1).strip())
 
     return title, link
 
@@ -5,8 +5,13 @@ import json
 import os
 import re
 import sys
+from collections import deque
 from pathlib import Path
-from difflib import SequenceMatcher
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 # Ensure the project root is importable so `from src.* import ...` works
 # when run from the project directory (e.g., `python scripts/run_alerts.py`)
@@ -18,6 +23,7 @@ from src.utils import (
     normalize_title,
     tokenize_title,
     jaccard_similarity,
+    sequence_similarity,
     extract_entities,
     get_event_type,
     canonicalize_url,
@@ -59,13 +65,35 @@ ENABLE_AI_FILTER = bool(os.environ.get("ANTHROPIC_API_KEY"))
 def load_json(path: Path, default):
     if not path.exists():
         return default
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 
+# Parsed blocklist keyed on the file's mtime, so the per-item check below
+# doesn't re-read and re-parse blocklist.json for every candidate.
+_BLOCKLIST_CACHE: dict = {"mtime": None, "blocklist": None}
+
+
+def load_blocklist() -> dict:
+    """Load blocklist.json, reusing the parsed copy while the file is unchanged."""
+    try:
+        mtime = BLOCKLIST_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+
+    if _BLOCKLIST_CACHE["blocklist"] is None or _BLOCKLIST_CACHE["mtime"] != mtime:
+        _BLOCKLIST_CACHE["blocklist"] = load_json(
+            BLOCKLIST_PATH, {"blocked_urls": [], "blocked_keywords": [], "blocked_sources": []}
+        )
+        _BLOCKLIST_CACHE["mtime"] = mtime
+    return _BLOCKLIST_CACHE["blocklist"]
+
+
 def is_blocklisted(item: dict) -> tuple[bool, str]:
     """Check if an item matches any blocklist rule. Returns (blocked, reason)."""
-    blocklist = load_json(BLOCKLIST_PATH, {"blocked_urls": [], "blocked_keywords": [], "blocked_sources": []})
+    blocklist = load_blocklist()
 
     item_url = (item.get("link") or item.get("url") or "").strip()
     if item_url in blocklist.get("blocked_urls", []):
@@ -85,8 +113,12 @@ def is_blocklisted(item: dict) -> tuple[bool, str]:
 
 def save_json(path: Path, obj):
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # Same layout as json.dump(indent=2, ensure_ascii=False), serialized in C
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
+    # json.dump() issues one small write per token; encode once, write once.
+    path.write_bytes(json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8"))
 
 
 def stable_item_id(item: dict) -> str:
@@ -103,26 +135,32 @@ def has_date(item: dict) -> bool:
 
 
 def clean_title(title: str) -> str:
-    t = (title or "").strip()
-    t = re.sub(r"\s+", " ", t)
-    return t
+    # split()/join strips and collapses whitespace runs in one C-level pass
+    return " ".join((title or "").split())
+
+
+# Characters Telegram's HTML parse mode requires escaping
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_NEEDS_ESCAPE = re.compile(r"[&<>]").search
 
 
 def build_message_html(title: str, link: str) -> str:
     # Telegram HTML formatting: bold + ... anchor
-    safe_title = title.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-    safe_link = link.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    # Most titles/links contain nothing to escape; skip the translate copy then.
+    safe_title = title.translate(_HTML_ESCAPE) if _NEEDS_ESCAPE(title) else title
+    safe_link = link.translate(_HTML_ESCAPE) if _NEEDS_ESCAPE(link) else link
     return f"<b>{safe_title}</b> <a href=\"{safe_link}\">...</a>"
 
 
-def title_similarity(title1: str, title2: str) -> float:
+def title_similarity(title1: str, title2: str, score_cutoff: float = 0.0) -> float:
     """
     Calculate similarity between two titles (0.0 to 1.0).
-    Uses SequenceMatcher on normalized titles.
+    Uses sequence_similarity() on normalized titles; scores below
+    score_cutoff may come back as 0.0.
     """
     norm1 = normalize_title(title1)
     norm2 = normalize_title(title2)
-    return SequenceMatcher(None, norm1, norm2).ratio()
+    return sequence_similarity(norm1, norm2, score_cutoff)
 
 
 def is_similar_to_seen(title: str, seen_titles: list[dict], threshold: float = SIMILARITY_THRESHOLD) -> tuple[bool, str | None]:
@@ -157,7 +195,8 @@ def is_similar_to_seen(title: str, seen_titles: list[dict], threshold: float = S
             continue
 
         # --- Method 1: SequenceMatcher (original) ---
-        seq_sim = title_similarity(title, seen_title)
+        # 0.50 is the lowest score the decision logic below acts on
+        seq_sim = title_similarity(title, seen_title, min(threshold, 0.50))
 
         # --- Method 2: Jaccard token overlap ---
         seen_tokens = tokenize_title(seen_title)
@@ -239,8 +278,13 @@ def main():
 
     # Load state
     state = load_json(STATE_PATH, {"seen": [], "seen_titles": []})
-    seen = set(state.get("seen", []))
-    seen_titles = state.get("seen_titles", [])
+    # Insertion-ordered set: new ids are appended, so the saved list never
+    # needs re-sorting and the committed state file diffs stay append-only.
+    seen = dict.fromkeys(state.get("seen", []))
+    loaded_seen_count = len(seen)
+    # Keep only last 500 seen titles to prevent unbounded growth
+    # (was 100 — too small, caused duplicates when same story re-appeared)
+    seen_titles = deque(state.get("seen_titles", []), maxlen=500)
 
     # Load user feedback for ranking agent
     feedback_data = load_json(FEEDBACK_PATH, {"signals": [], "learned_rules": []})
@@ -260,7 +304,7 @@ def main():
         if fe_title and fe_link:
             fe_id = stable_item_id({"title": fe_title, "link": fe_link})
             if fe_id not in seen:
-                seen.add(fe_id)
+                seen[fe_id] = None
                 feed_dedup_count += 1
     if feed_dedup_count:
         print(f"📋 Registered {feed_dedup_count} feed.json entries in dedup set")
@@ -273,20 +317,9 @@ def main():
     )
     print(f"🔍 Dedup agent: initialized")
 
-    # Filter: only dated items, only new (not seen)
-    new_items = []
-    for it in items:
-        if not has_date(it):
-            continue
-        iid = stable_item_id(it)
-        if iid in seen:
-            continue
-        new_items.append(it)
-
-    print(f"🆕 New items (not seen, dated): {len(new_items)}")
-
     # Build drafts (one per story)
     drafts = []
+    new_count = 0
     skipped_no_title = 0
     skipped_no_link = 0
     skipped_similar = 0
@@ -294,8 +327,17 @@ def main():
     skipped_telegram = 0
     skipped_blocklist = 0
     skipped_ai_filter = 0       # Count of AI-rejected articles
+    low_score_log = []          # Most items stop at the score gate; log them in one write
+
+    for it in items:
+        # Filter: only dated items, only new (not seen)
+        if not has_date(it):
+            continue
+        iid = stable_item_id(it)
+        if iid in seen:
+            continue
+        new_count += 1
 
-    for it in new_items:
         title = clean_title(it.get("title") or "")
         link = (it.get("link") or it.get("url") or "").strip()
         snippet = (it.get("snippet") or "")[:300]
@@ -339,15 +381,14 @@ def main():
             if not reason:
                 reason.append(f"score={score}")
 
-            print(f"⚖️  Filtered low score ({', '.join(reason)}): \"{title[:70]}...\"")
+            low_score_log.append(f"⚖️  Filtered low score ({', '.join(reason)}): \"{title[:70]}...\"")
             continue
 
         # Unified dedup check (SQLite + seen_titles + feed.json + session cache)
         is_dup, dup_reason = dedup_agent.is_duplicate(title, link, snippet)
         if is_dup:
             skipped_similar += 1
-            print(f"🔁 Dedup: \"{title[:70]}...\"")
-            print(f"   Reason: {dup_reason}")
+            print(f"🔁 Dedup: \"{title[:70]}...\"\n   Reason: {dup_reason}")
             continue
 
         # Ranking agent: determines tier + platform eligibility
@@ -362,8 +403,10 @@ def main():
 
         if ranking["tier"] == "reject":
             skipped_ai_filter += 1
-            print(f"🤖 Rejected [{ranking.get('category', '?')}]: \"{title[:70]}...\"")
-            print(f"   Reason: {ranking['reason']}")
+            print(
+                f"🤖 Rejected [{ranking.get('category', '?')}]: \"{title[:70]}...\"\n"
+                f"   Reason: {ranking['reason']}"
+            )
             continue
 
         if not ranking["post_to_telegram"]:
@@ -393,8 +436,6 @@ def main():
             except Exception as e:
                 print(f"⚠️  Quality review error ({e}), continuing with original title")
 
-        iid = stable_item_id(it)
-
         # Build the draft entry
         draft_entry = {
             "id": iid,
@@ -420,7 +461,7 @@ def main():
         )
 
         # Mark as seen so we don't re-create approval issues every 5 mins
-        seen.add(iid)
+        seen[iid] = None
 
         # Store title for future similarity checks
         seen_titles.append({
@@ -432,6 +473,11 @@ def main():
     # Clean up dedup agent resources
     dedup_agent.close()
 
+    if low_score_log:
+        print("\n".join(low_score_log))
+
+    print(f"🆕 New items (not seen, dated): {new_count}")
+
     # Write drafts
     save_json(DRAFTS_PATH, drafts)
     print(f"\n📝 Wrote drafts: {DRAFTS_PATH} ({len(drafts)} drafts)")
@@ -456,14 +502,13 @@ def main():
     if skip_parts:
         print(f"⚠️  Skipped: {', '.join(skip_parts)}")
 
-    # Keep only last 500 seen titles to prevent unbounded growth
-    # (was 100 — too small, caused duplicates when same story re-appeared)
-    if len(seen_titles) > 500:
-        seen_titles = seen_titles[-500:]
+    # Save state (only when this run registered something new)
+    if len(seen) == loaded_seen_count and not drafts:
+        print(f"💾 State unchanged: {STATE_PATH} (seen={len(seen)}, seen_titles={len(seen_titles)})")
+        return 0
 
-    # Save state
-    state["seen"] = sorted(seen)
-    state["seen_titles"] = seen_titles
+    state["seen"] = list(seen)
+    state["seen_titles"] = list(seen_titles)
     save_json(STATE_PATH, state)
     print(f"💾 Updated state: {STATE_PATH} (seen={len(state['seen'])}, seen_titles={len(seen_titles)})")
 
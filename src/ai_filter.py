@@ -29,7 +29,6 @@ import hashlib
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from difflib import SequenceMatcher
 from typing import Optional
 
 from .utils import (
@@ -37,6 +36,7 @@ from .utils import (
     canonicalize_url,
     tokenize_title,
     jaccard_similarity,
+    sequence_similarity,
     extract_entities,
     get_event_type,
 )
@@ -176,7 +176,10 @@ class ArticleDatabase:
 
         for posted_title, posted_norm in rows:
             # Check 2: SequenceMatcher (existing)
-            similarity = SequenceMatcher(None, norm_title, posted_norm).ratio()
+            # 0.50 is the lowest score Check 3 below acts on
+            similarity = sequence_similarity(
+                norm_title, posted_norm, score_cutoff=min(threshold, 0.50)
+            )
             if similarity >= threshold:
                 return True, (
                     f"similar title (score={similarity:.2f}): "
@@ -1,15 +1,18 @@
 import json
 import os
 import re
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 
 from .fetchers import fetch_google_news_rss, fetch_telegram_public_channels
 from .normalize import normalize_item
-from .match import match_item
+from .match import build_matcher, match_item
 from .dedupe import hard_dedupe, cluster_and_select
 from .output import write_json, write_markdown_digest
-from .utils import ensure_parent_dir
-from .improved_scoring import score_item_improved
+from .utils import ensure_parent_dir, make_session
+from .improved_scoring import item_text, score_item_improved
 
 
 # =========================
@@ -117,9 +120,32 @@ PROMO_PATTERNS = [
 ]
 
 
-def _count(patterns, text: str) -> int:
+def _compile_group(patterns):
+    """Compile a pattern list plus one alternation of all of them.
+
+    The alternation matches iff at least one pattern does, so a single
+    scan rules out the (common) no-hit case before counting per pattern.
+    """
+    any_re = re.compile("|".join(f"(?:{p})" for p in patterns))
+    return any_re, [re.compile(p) for p in patterns]
+
+
+# Compiled once at import; _count() runs every group for each scored item
+_TIER1_LAUNCH_RES = _compile_group(TIER1_LAUNCH_PATTERNS)
+_TIER2_ACTIVITY_RES = _compile_group(TIER2_ACTIVITY_PATTERNS)
+_COMMENTARY_RES = _compile_group(COMMENTARY_PATTERNS)
+_LISTICLE_RES = _compile_group(LISTICLE_PATTERNS)
+_GENERIC_RES = _compile_group(GENERIC_PATTERNS)
+_PROMO_RES = _compile_group(PROMO_PATTERNS)
+
+
+def _count(group, text: str) -> int:
+    """Number of distinct patterns in the group that match text."""
+    any_re, patterns = group
     t = (text or "").lower()
-    return sum(1 for p in patterns if re.search(p, t))
+    if not any_re.search(t):
+        return 0
+    return sum(1 for p in patterns if p.search(t))
 
 
 
@@ -199,25 +225,38 @@ PR_NEWSWIRE_NOISE = [
 ]
 
 
-def is_pr_noise(item: dict) -> bool:
+def _compile_substrings(words):
+    """One alternation of escaped literals: matches iff any word is a substring."""
+    return re.compile("|".join(re.escape(w) for w in words))
+
+
+_CRYPTO_ANCHORS_RE = _compile_substrings(CRYPTO_ANCHORS)
+_NOISE_RE = _compile_substrings(NOISE_PATTERNS)
+_PR_NEWSWIRE_NOISE_RE = _compile_substrings(PR_NEWSWIRE_NOISE)
+
+
+def is_pr_noise(item: dict, text: str = None) -> bool:
     """Filter out generic PR announcements (meeting notices, appointments, etc.)."""
     url = item.get('url', '').lower()
     if "prnewswire" not in url and "businesswire" not in url:
         return False
 
-    text = f"{item.get('title','')} {item.get('snippet','')}".lower()
-    return any(pattern in text for pattern in PR_NEWSWIRE_NOISE)
+    if text is None:
+        text = item_text(item)
+    return _PR_NEWSWIRE_NOISE_RE.search(text) is not None
 
 
 
-def has_crypto_anchor(item: dict) -> bool:
-    text = f"{item.get('title','')} {item.get('snippet','')}".lower()
-    return any(w in text for w in CRYPTO_ANCHORS)
+def has_crypto_anchor(item: dict, text: str = None) -> bool:
+    if text is None:
+        text = item_text(item)
+    return _CRYPTO_ANCHORS_RE.search(text) is not None
 
 
-def is_noise(item: dict) -> bool:
-    text = f"{item.get('title','')} {item.get('snippet','')}".lower()
-    return any(p in text for p in NOISE_PATTERNS)
+def is_noise(item: dict, text: str = None) -> bool:
+    if text is None:
+        text = item_text(item)
+    return _NOISE_RE.search(text) is not None
 
 
 def load_blocklist(path: str = "blocklist.json") -> dict:
@@ -246,6 +285,10 @@ def is_blocklisted(item: dict, blocklist: dict) -> bool:
     return False
 
 
+# Concurrent Google News RSS fetches (I/O-bound; GIL is released on socket reads)
+RSS_FETCH_WORKERS = 8
+
+
 def load_config(path: str = "config.json") -> dict:
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
@@ -266,13 +309,26 @@ def main() -> int:
     raw_items = []
     if cfg.get("google_news_rss", {}).get("enabled", True):
         feeds = cfg.get("google_news_rss", {}).get("feeds", {})
-        for feed_name, feed_url in feeds.items():
-            items = fetch_google_news_rss(
-                feed_name=feed_name,
-                feed_url=feed_url,
-                http_cfg=cfg.get("http", {}),
+        http_cfg = cfg.get("http", {})
+        # Feeds are I/O-bound: fetch them concurrently. requests.Session is not
+        # documented as thread-safe, so each worker thread keeps its own pooled
+        # session for the feeds it fetches. map() keeps results in config order.
+        local = threading.local()
+
+        def fetch_feed(feed):
+            session = getattr(local, "session", None)
+            if session is None:
+                session = local.session = make_session(http_cfg)
+            return fetch_google_news_rss(
+                feed_name=feed[0],
+                feed_url=feed[1],
+                http_cfg=http_cfg,
+                session=session,
             )
-            raw_items.extend(items)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(RSS_FETCH_WORKERS, len(feeds)))) as pool:
+            for items in pool.map(fetch_feed, feeds.items()):
+                raw_items.extend(items)
 
     # Telegram public channels (optional)
     tg_cfg = cfg.get("telegram", {}) or {}
@@ -299,36 +355,55 @@ def main() -> int:
 
     print(f"\n📥 Raw items fetched: {len(raw_items)}")
 
-    from collections import Counter
+    # Debug dumps are opt-in: serializing every raw/dropped item costs a full
+    # extra pass per run, and production never reads them.
+    debug = bool(os.environ.get("FINTECHNEWS_DEBUG"))
+    if debug:
+        write_json("out/debug_raw.json", raw_items, indent=False)
+        print("🧪 Wrote debug: out/debug_raw.json")
 
-    raw_src_types = Counter([(r.get("source_type") or "rss") for r in raw_items])
-    raw_sources = Counter([(r.get("source") or "Unknown") for r in raw_items])
-    print("🧾 Raw source_type counts:", raw_src_types.most_common(10))
-    print("🧾 Raw source counts:", raw_sources.most_common(10))
+    blocklist = load_blocklist()
+    keywords = cfg.get("keywords", [])
+    topics = cfg.get("topics", [])
+    # Keyword regexes and folded topic terms are fixed for the run: build once
+    matcher = build_matcher(keywords, topics)
+
+    raw_src_types = Counter()
+    raw_sources = Counter()
+    normalized_count = 0
+    matched_count = 0
+    blocked_count = 0
+    src_counts = Counter()
+    kw_counts = Counter()
 
-    write_json("out/debug_raw.json", raw_items)
-    print("🧪 Wrote debug: out/debug_raw.json")
+    # Windowing: drop undated and out-of-window items entirely
+    windowed = []
+    dropped_undated = []
+    dropped_old = []
 
-    normalized = []
-    for r in raw_items:
-        n = normalize_item(r, fetched_at=now_utc)
-        if n is not None:
-            normalized.append(n)
+    # Parse each timestamp once and compare epoch seconds; scoring reuses the
+    # epoch for freshness (popped there so it never reaches the outputs).
+    cutoff_epoch = cutoff.timestamp()
 
-    print(f"🧹 Normalized items: {len(normalized)}")
+    # One pass per raw item: normalize -> match -> noise/blocklist/anchor gates
+    # -> time window, tallying the summary counters along the way.
+    for r in raw_items:
+        raw_src_types[r.get("source_type") or "rss"] += 1
+        raw_sources[r.get("source") or "Unknown"] += 1
 
-    blocklist = load_blocklist()
-    blocked_count = 0
+        item = normalize_item(r, fetched_at=now_utc)
+        if item is None:
+            continue
+        normalized_count += 1
 
-    matched = []
-    for item in normalized:
-        m = match_item(item, cfg.get("keywords", []), cfg.get("topics", []))
+        m = match_item(item, keywords, topics, matcher=matcher)
 
         if not (m.get("matched_keywords") or m.get("matched_topics")):
             continue
-        if is_noise(m):
+        text = item_text(m)
+        if is_noise(m, text):
             continue
-        if is_pr_noise(m):
+        if is_pr_noise(m, text):
             continue
         if is_blocklisted(m, blocklist):
             blocked_count += 1
@@ -338,55 +413,51 @@ def main() -> int:
         # items are already crypto-focused by nature. Don't drop them just
         # because they don't contain anchor words.
         if (m.get("source_type") or "").lower() not in ("telegram",):
-            if not has_crypto_anchor(m):
+            if not has_crypto_anchor(m, text):
                 continue
 
-        matched.append(m)
-
-    print(f"🎯 Matched items: {len(matched)}")
-    if blocked_count:
-        print(f"🚫 Blocklisted items: {blocked_count}")
-
-    src_counts = Counter([i.get("source") for i in matched])
-    print("🏷 Top sources:", src_counts.most_common(10))
-
-    kw_counts = Counter()
-    for i in matched:
-        for kw in i.get("matched_keywords") or []:
-            kw_counts[kw] += 1
-    print("🔑 Top keywords:", kw_counts.most_common(15))
+        matched_count += 1
+        src_counts[m.get("source")] += 1
+        kw_counts.update(m.get("matched_keywords") or ())
 
-    # Windowing: drop undated and out-of-window items entirely
-    windowed = []
-    dropped_undated = []
-    dropped_old = []
-
-    for item in matched:
-        published_at = item.get("published_at")
+        published_at = m.get("published_at")
         if not published_at:
-            dropped_undated.append(item)
+            dropped_undated.append(m)
             continue
 
+        if published_at.endswith("Z"):
+            published_at = published_at[:-1] + "+00:00"
         try:
-            dt = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
+            published_epoch = datetime.fromisoformat(published_at).timestamp()
         except Exception:
-            dropped_undated.append(item)
+            dropped_undated.append(m)
             continue
 
-        if dt < cutoff:
-            dropped_old.append(item)
+        if published_epoch < cutoff_epoch:
+            dropped_old.append(m)
             continue
 
-        windowed.append(item)
+        m["_published_epoch"] = published_epoch
+        windowed.append(m)
+
+    print("🧾 Raw source_type counts:", raw_src_types.most_common(10))
+    print("🧾 Raw source counts:", raw_sources.most_common(10))
+    print(f"🧹 Normalized items: {normalized_count}")
+    print(f"🎯 Matched items: {matched_count}")
+    if blocked_count:
+        print(f"🚫 Blocklisted items: {blocked_count}")
+    print("🏷 Top sources:", src_counts.most_common(10))
+    print("🔑 Top keywords:", kw_counts.most_common(15))
 
     print(f"⏱️  In window (last {lookback_hours}h): {len(windowed)}")
     print(f"🗑️  Dropped undated: {len(dropped_undated)}")
     print(f"🗑️  Dropped older than window: {len(dropped_old)}")
 
-    write_json("out/debug_dropped_undated.json", dropped_undated)
-    write_json("out/debug_dropped_old.json", dropped_old)
-    print("🧪 Wrote debug: out/debug_dropped_undated.json")
-    print("🧪 Wrote debug: out/debug_dropped_old.json")
+    if debug:
+        write_json("out/debug_dropped_undated.json", dropped_undated, indent=False)
+        write_json("out/debug_dropped_old.json", dropped_old, indent=False)
+        print("🧪 Wrote debug: out/debug_dropped_undated.json")
+        print("🧪 Wrote debug: out/debug_dropped_old.json")
 
     # 1) Hard dedupe first
     windowed = hard_dedupe(windowed)
@@ -395,15 +466,20 @@ def main() -> int:
     # Use improved scoring
     windowed_scored = []
     for it in windowed:
-        text = f"{it.get("title","")} {it.get("snippet","")}".lower()
-        tier1 = _count(TIER1_LAUNCH_PATTERNS, text)
-        tier2 = _count(TIER2_ACTIVITY_PATTERNS, text)
-        comm = _count(COMMENTARY_PATTERNS, text)
-        listicle = _count(LISTICLE_PATTERNS, it.get("title", "").lower())
-        generic = _count(GENERIC_PATTERNS, it.get("title", "").lower())
-        promo = _count(PROMO_PATTERNS, it.get("title", "").lower())
+        # Lowercase once per item; the counters and scoring helpers share it.
+        text = item_text(it)
+        title = it.get("title", "").lower()
+        tier1 = _count(_TIER1_LAUNCH_RES, text)
+        tier2 = _count(_TIER2_ACTIVITY_RES, text)
+        comm = _count(_COMMENTARY_RES, text)
+        listicle = _count(_LISTICLE_RES, title)
+        generic = _count(_GENERIC_RES, title)
+        promo = _count(_PROMO_RES, title)
         generic += promo  # promo patterns count as generic
-        scored = score_item_improved(it, now_utc, tier1, tier2, comm, listicle, generic)
+        scored = score_item_improved(
+            it, now_utc, tier1, tier2, comm, listicle, generic,
+            text=text, published_epoch=it.pop("_published_epoch", None),
+        )
         windowed_scored.append(scored)
 
     # 3) Cluster similar titles across sources, apply consensus boost, select representative
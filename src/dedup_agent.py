@@ -12,7 +12,6 @@ import os
 import sqlite3
 import hashlib
 from datetime import datetime, timezone
-from difflib import SequenceMatcher
 from pathlib import Path
 from typing import Optional
 
@@ -21,6 +20,7 @@ from .utils import (
     canonicalize_url,
     tokenize_title,
     jaccard_similarity,
+    sequence_scorer,
     extract_entities,
     get_event_type,
 )
@@ -89,6 +89,8 @@ class DedupAgent:
         # Build unified title list from all sources
         self._all_titles: list[dict] = []  # [{title, link}]
         self._session_cache: list[dict] = []  # Titles added in this batch
+        # (entity, event type) -> entries; built on first is_duplicate() call
+        self._event_index: dict[tuple[str, str], list[dict]] | None = None
 
         # Load seen_alerts titles
         for t in (seen_titles or []):
@@ -138,6 +140,42 @@ class DedupAgent:
         canonical = canonicalize_url((url or "").strip())
         return hashlib.sha256(canonical.lower().encode("utf-8")).hexdigest()
 
+    @staticmethod
+    def _features(entry: dict) -> tuple:
+        """(normalized title, tokens, entities, event type, seq scorer) for a stored entry.
+
+        Computed on first comparison and cached on the entry, so each stored
+        title is analysed once per run instead of once per candidate.
+        """
+        features = entry.get("features")
+        if features is None:
+            title = entry["title"]
+            norm = normalize_title(title)
+            features = (
+                norm,
+                tokenize_title(title),
+                extract_entities(title),
+                get_event_type(title),
+                sequence_scorer(norm),
+            )
+            entry["features"] = features
+        return features
+
+    def _index_entry(self, entry: dict):
+        if not entry.get("title"):
+            return
+        _, _, entities, event, _ = self._features(entry)
+        if event is not None:
+            for entity in entities:
+                self._event_index.setdefault((entity, event), []).append(entry)
+
+    def _get_event_index(self) -> dict[tuple[str, str], list[dict]]:
+        if self._event_index is None:
+            self._event_index = {}
+            for entry in self._all_titles + self._session_cache:
+                self._index_entry(entry)
+        return self._event_index
+
     def is_duplicate(self, title: str, url: str, snippet: str = "") -> tuple[bool, str]:
         """Check all dedup sources. Returns (is_dup, reason)."""
 
@@ -150,12 +188,29 @@ class DedupAgent:
             return True, f"exact URL match (previously: \"{row[0][:80]}\")"
 
         # Step 2: Title-based matching against all sources
+        norm_current = normalize_title(title)
+        len_current = len(norm_current)
         current_tokens = tokenize_title(title)
         current_entities = extract_entities(title)
         current_event = get_event_type(title)
         is_launch = current_event is not None
         seq_threshold = LAUNCH_SEQ_THRESHOLD if is_launch else SEQ_THRESHOLD
 
+        # Fast path for rule (A)'s aggressive tier: same entity + same event.
+        # The full scan below would find these too; the index lets the common
+        # "same launch, another outlet" case return without scanning everything.
+        # The 0.50 cutoff here and the length bound below both assume the
+        # scorer from sequence_scorer() returns difflib-equivalent scores
+        # (2*matches / total length); a different metric would change verdicts.
+        if is_launch and current_entities:
+            index = self._get_event_index()
+            for entity in sorted(current_entities):
+                for entry in index.get((entity, current_event), ()):
+                    _, seen_tokens, _, _, seq_to_seen = self._features(entry)
+                    jac_sim = jaccard_similarity(current_tokens, seen_tokens)
+                    if jac_sim >= 0.30 or seq_to_seen(norm_current, 0.50) >= 0.50:
+                        return True, f"entity+event match ({entity}, {current_event}): \"{entry['title'][:80]}\""
+
         # Check against all titles (seen_alerts + feed.json + SQLite + session cache)
         all_to_check = self._all_titles + self._session_cache
         borderline_match: Optional[str] = None
@@ -165,16 +220,29 @@ class DedupAgent:
             if not seen_title:
                 continue
 
-            norm_current = normalize_title(title)
-            norm_seen = normalize_title(seen_title)
-            seq_sim = SequenceMatcher(None, norm_current, norm_seen).ratio()
-
-            seen_tokens = tokenize_title(seen_title)
+            norm_seen, seen_tokens, seen_entities, seen_event, seq_to_seen = self._features(entry)
             jac_sim = jaccard_similarity(current_tokens, seen_tokens)
-
-            seen_entities = extract_entities(seen_title)
             shared_entities = current_entities & seen_entities
-            seen_event = get_event_type(seen_title)
+
+            # Lowest seq score rule (A) below can act on for this pair
+            if is_launch and seen_event is not None:
+                if shared_entities and current_event == seen_event:
+                    min_seq = 0.50
+                elif shared_entities:
+                    min_seq = 0.80
+                else:
+                    min_seq = 0.85
+            else:
+                min_seq = seq_threshold
+
+            # 2*matches / total length can't exceed 2*min_len / total length;
+            # skip the matcher when even a perfect alignment falls short. Only
+            # valid while seq_to_seen scores like difflib (see fast path above).
+            total_len = len_current + len(norm_seen)
+            if total_len and 2 * min(len_current, len(norm_seen)) < min_seq * total_len:
+                seq_sim = 0.0
+            else:
+                seq_sim = seq_to_seen(norm_current, min_seq)
 
             # High-confidence matches — no AI needed
 
@@ -268,7 +336,10 @@ class DedupAgent:
             ),
         )
         self.conn.commit()
-        self._session_cache.append({"title": title, "link": url})
+        entry = {"title": title, "link": url}
+        self._session_cache.append(entry)
+        if self._event_index is not None:
+            self._index_entry(entry)
 
     def close(self):
         self.conn.close()
@@ -8,7 +8,7 @@ This file must export: hard_dedupe, cluster_and_select
 
 from __future__ import annotations
 
-from .utils import canonicalize_url, normalize_title, tokenize_title, jaccard_similarity
+from .utils import canonicalize_url, normalize_title, tokenize_title
 
 
 # -------------------------
@@ -68,17 +68,49 @@ def cluster_and_select(items: list[dict], now_utc=None, sim_threshold: float = 0
 
     enriched: list[tuple[dict, set[str]]] = [(it, tokenize_title(it.get("title") or "")) for it in items]
 
+    # Intern each distinct token to a bit position so a title's token set is
+    # one int; the overlap with a rep is then a single AND + bit_count().
+    vocab: dict[str, int] = {}
+    bits: list[int] = []
+    for _it, tok in enriched:
+        mask = 0
+        for w in tok:
+            mask |= 1 << vocab.setdefault(w, len(vocab))
+        bits.append(mask)
+
     clusters: list[list[tuple[dict, set[str]]]] = []
-    for it, tok in enriched:
+    rep_bits: list[int] = []
+    # token -> indices of clusters whose representative contains it. A rep that
+    # shares no token has Jaccard 0, so only these candidates need comparing;
+    # visiting them in cluster order keeps the greedy first-match assignment.
+    rep_index: dict[str, list[int]] = {}
+    for (it, tok), mask in zip(enriched, bits):
         placed = False
-        for cl in clusters:
-            rep_tok = cl[0][1]
-            if jaccard_similarity(tok, rep_tok) >= sim_threshold:
+        la = len(tok)
+        if sim_threshold > 0:
+            candidates = sorted({ci for w in tok for ci in rep_index.get(w, ())})
+        else:
+            candidates = range(len(clusters))
+        for ci in candidates:
+            cl = clusters[ci]
+            lb = len(cl[0][1])
+            if la and lb:
+                # Jaccard <= min/max of the set sizes; skip reps that can't reach the threshold.
+                if min(la, lb) / max(la, lb) < sim_threshold:
+                    continue
+                inter = (mask & rep_bits[ci]).bit_count()
+                sim = inter / (la + lb - inter)
+            else:
+                sim = 0.0
+            if sim >= sim_threshold:
                 cl.append((it, tok))
                 placed = True
                 break
         if not placed:
+            for w in tok:
+                rep_index.setdefault(w, []).append(len(clusters))
             clusters.append([(it, tok)])
+            rep_bits.append(mask)
 
     selected: list[dict] = []
 
@@ -4,6 +4,7 @@ import re
 from datetime import datetime, timezone
 
 import feedparser
+import requests
 
 from .utils import make_session
 
@@ -16,12 +17,22 @@ except Exception:  # pragma: no cover
     TelegramClient = None
 
 
-def fetch_google_news_rss(feed_name: str, feed_url: str, http_cfg: dict) -> List[Dict[str, Any]]:
+def fetch_google_news_rss(
+    feed_name: str,
+    feed_url: str,
+    http_cfg: dict,
+    session: Optional[requests.Session] = None,
+) -> List[Dict[str, Any]]:
     """
     Fetch Google News RSS URL and return raw items:
     {source_type, source, feed_name, title, link, description, published, raw}
+
+    Pass a session (from make_session) to reuse its connection pool across
+    feeds; one is created per call otherwise. Don't share one session across
+    threads.
     """
-    session = make_session(http_cfg)
+    if session is None:
+        session = make_session(http_cfg)
     headers = {
         "User-Agent": (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -34,7 +45,7 @@ def fetch_google_news_rss(feed_name: str, feed_url: str, http_cfg: dict) -> List
     r = session.get(feed_url, headers=headers, timeout=int(http_cfg.get("timeout_seconds", 20)))
 
     ctype = (r.headers.get("Content-Type") or "").lower()
-    print(f"   ↳ HTTP {r.status_code}, content-type={ctype}, bytes={len(r.content)}")
+    print(f"   ↳ [{feed_name}] HTTP {r.status_code}, content-type={ctype}, bytes={len(r.content)}")
 
     if r.status_code >= 400:
         snippet = (r.text or "")[:200]
@@ -43,7 +54,7 @@ def fetch_google_news_rss(feed_name: str, feed_url: str, http_cfg: dict) -> List
 
     feed = feedparser.parse(r.content)
     entries = getattr(feed, "entries", []) or []
-    print(f"   ↳ entries={len(entries)}, bozo={getattr(feed, 'bozo', 0)}")
+    print(f"   ↳ [{feed_name}] entries={len(entries)}, bozo={getattr(feed, 'bozo', 0)}")
 
     items = []
     for e in entries:
@@ -126,9 +137,15 @@ def fetch_telegram_public_channels(
         raise RuntimeError("TG_API_ID must be an integer")
 
     event_keywords = event_keywords or []
+    # One alternation of the lowercased keywords, built once rather than
+    # lowercasing every keyword for every message.
+    event_re = (
+        re.compile("|".join(re.escape((kw or "").lower()) for kw in event_keywords))
+        if event_keywords
+        else None
+    )
 
     def passes_gate(text: str) -> bool:
-        t = (text or "").lower()
         has_url = bool(_extract_first_url(text))
 
         # If primary link is required, URL passes immediately.
@@ -136,9 +153,8 @@ def fetch_telegram_public_channels(
             return True
 
         # Accept if event keyword matches.
-        for kw in event_keywords:
-            if (kw or "").lower() in t:
-                return True
+        if event_re is not None and event_re.search((text or "").lower()) is not None:
+            return True
 
         # If primary link is not required, URL-only also passes.
         if not require_primary_link and has_url:
@@ -147,72 +163,79 @@ def fetch_telegram_public_channels(
         return False
 
     async def _run() -> List[Dict[str, Any]]:
-        items: List[Dict[str, Any]] = []
-
-        print(f"🟦 Fetching Telegram channels: {len(channels)}")
+        # Accept @handle or plain handle; skip blanks.
+        handles = []
+        for ch in channels:
+            ch = (ch or "").strip()
+            if not ch:
+                continue
+            if not ch.startswith("@"):  # public username
+                ch = "@" + ch
+            handles.append(ch)
+
+        print(f"🟦 Fetching Telegram channels: {len(handles)}")
+
+        async def fetch_one(client, ch: str) -> List[Dict[str, Any]]:
+            items: List[Dict[str, Any]] = []
+            try:
+                async for msg in client.iter_messages(ch, limit=max_messages_per_channel):
+                    if not msg or not getattr(msg, "message", None):
+                        continue
+
+                    text = (msg.message or "").strip()
+                    if not text:
+                        continue
+
+                    if not passes_gate(text):
+                        continue
+
+                    dt = getattr(msg, "date", None)
+                    published_iso = ""
+                    if dt:
+                        if dt.tzinfo is None:
+                            dt = dt.replace(tzinfo=timezone.utc)
+                        dt_utc = dt.astimezone(timezone.utc)
+                        published_iso = dt_utc.isoformat().replace("+00:00", "Z")
+
+                    external_url = _extract_first_url(text)
+                    permalink = _tg_permalink(ch, getattr(msg, "id", 0))
+
+                    title = text.split("\n", 1)[0].strip()
+                    if len(title) > 160:
+                        title = title[:157] + "..."
+
+                    description = text
+                    if len(description) > 800:
+                        description = description[:797] + "..."
+
+                    items.append(
+                        {
+                            "source_type": "telegram",
+                            "source": "Telegram",
+                            "source_name": ch,
+                            "title": title,
+                            "link": external_url or permalink,
+                            "description": description,
+                            "published": published_iso,
+                            "raw": {
+                                "tg_permalink": permalink,
+                                "external_url": external_url or None,
+                                "message_id": getattr(msg, "id", None),
+                            },
+                        }
+                    )
+            except Exception as e:
+                # Don't fail the entire run because one channel is missing/private/etc.
+                print(f"⚠️  Telegram channel failed {ch}: {e}")
+            return items
 
         # Creates/uses a local session file. First run may prompt a login code.
+        # Channels are fetched concurrently over the one client connection;
+        # results are flattened back in channel order.
         async with TelegramClient(session_path, api_id, api_hash) as client:
-            for ch in channels:
-                ch = (ch or "").strip()
-                if not ch:
-                    continue
-
-                # Accept @handle or plain handle.
-                if not ch.startswith("@"):  # public username
-                    ch = "@" + ch
-
-                try:
-                    async for msg in client.iter_messages(ch, limit=max_messages_per_channel):
-                        if not msg or not getattr(msg, "message", None):
-                            continue
-
-                        text = (msg.message or "").strip()
-                        if not text:
-                            continue
-
-                        if not passes_gate(text):
-                            continue
-
-                        dt = getattr(msg, "date", None)
-                        published_iso = ""
-                        if dt:
-                            if dt.tzinfo is None:
-                                dt = dt.replace(tzinfo=timezone.utc)
-                            dt_utc = dt.astimezone(timezone.utc)
-                            published_iso = dt_utc.isoformat().replace("+00:00", "Z")
-
-                        external_url = _extract_first_url(text)
-                        permalink = _tg_permalink(ch, getattr(msg, "id", 0))
-
-                        title = text.split("\n", 1)[0].strip()
-                        if len(title) > 160:
-                            title = title[:157] + "..."
-
-                        description = text
-                        if len(description) > 800:
-                            description = description[:797] + "..."
-
-                        items.append(
-                            {
-                                "source_type": "telegram",
-                                "source": "Telegram",
-                                "source_name": ch,
-                                "title": title,
-                                "link": external_url or permalink,
-                                "description": description,
-                                "published": published_iso,
-                                "raw": {
-                                    "tg_permalink": permalink,
-                                    "external_url": external_url or None,
-                                    "message_id": getattr(msg, "id", None),
-                                },
-                            }
-                        )
-                except Exception as e:
-                    # Don't fail the entire run because one channel is missing/private/etc.
-                    print(f"⚠️  Telegram channel failed {ch}: {e}")
-                    continue
+            results = await asyncio.gather(*(fetch_one(client, ch) for ch in handles))
+
+        items = [it for chunk in results for it in chunk]
 
         print(f"🟦 Telegram items fetched (post-gate): {len(items)}")
         return items
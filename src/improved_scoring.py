@@ -66,51 +66,113 @@ FINANCIAL_PATTERNS = [
 
 # Short/ambiguous tokens that need word-boundary matching to avoid false positives.
 # e.g. "block" matching "blockchain", "citi" matching "city", "sec" matching "second".
-_BOUNDARY_TOKENS = {
+_BOUNDARY_TOKENS = frozenset({
     "block", "citi", "wise", "visa", "square",
     "fed", "sec", "fca", "ubs", "okx",
-}
+})
+
+
+# Precompiled word-boundary patterns for the ambiguous tokens above.
+_BOUNDARY_RES = {t: re.compile(rf'\b{re.escape(t)}\b') for t in _BOUNDARY_TOKENS}
+
+
+def _token_pattern(token: str) -> str:
+    if token in _BOUNDARY_TOKENS:
+        return rf'\b{re.escape(token)}\b'
+    return re.escape(token)
+
+
+def _compile_any(tokens: list) -> "re.Pattern":
+    """One alternation over a token list: a single scan answers "any token present?"."""
+    return re.compile("|".join(_token_pattern(t) for t in tokens))
+
+
+# Compiled once at import; every scored item is checked against these lists.
+_REGULATORS_RE = _compile_any(REGULATORS)
+_TIER1_RE = _compile_any(TIER1_INSTITUTIONS)
+_TIER2_RE = _compile_any(TIER2_INSTITUTIONS)
+_REGULATORY_KEYWORDS_RE = _compile_any(REGULATORY_KEYWORDS)
+_CENTRAL_BANK_RE = _compile_any(["central bank", "monetary authority"])
+_CB_CRYPTO_RE = _compile_any(["stablecoin", "tokenized", "tokenization", "cbdc"])
+
+
+def _financial_tiers(patterns: list) -> list:
+    """Merge consecutive same-bonus FINANCIAL_PATTERNS into one alternation each.
+
+    The list is ordered by descending bonus and the first matching pattern
+    wins, so checking each tier in order returns the same bonus.
+    """
+    tiers = []
+    for pattern, bonus in patterns:
+        if tiers and tiers[-1][0] == bonus:
+            tiers[-1][1].append(pattern)
+        else:
+            tiers.append((bonus, [pattern]))
+    return [(bonus, re.compile("|".join(f"(?:{p})" for p in group))) for bonus, group in tiers]
+
+
+_FINANCIAL_TIERS = _financial_tiers(FINANCIAL_PATTERNS)
 
 
 def _token_in_text(token: str, text: str) -> bool:
     """Check if a token appears in text, using word boundaries for short/ambiguous tokens."""
     if token in _BOUNDARY_TOKENS:
-        return bool(re.search(rf'\b{re.escape(token)}\b', text))
+        return bool(_BOUNDARY_RES[token].search(text))
     return token in text
 
 
-def _any_token_in_text(tokens: list, text: str) -> bool:
-    """Check if any token from the list appears in text (boundary-aware)."""
-    return any(_token_in_text(t, text) for t in tokens)
+def _count_tokens(tokens: list, any_re: "re.Pattern", text: str) -> int:
+    """Number of distinct tokens from the list present in text (boundary-aware)."""
+    if not any_re.search(text):
+        return 0
+    return sum(1 for t in tokens if _token_in_text(t, text))
+
 
+def item_text(item: dict) -> str:
+    """Lowercased "title snippet" text that the scoring helpers match against."""
+    return f"{item.get('title','')} {item.get('snippet','')}".lower()
 
-def get_institution_bonus(item: dict) -> int:
-    """Calculate bonus points for institutional sources, with multi-institution boost."""
-    text = f"{item.get('title','')} {item.get('snippet','')}".lower()
 
+def _scan(text: str, title: str) -> dict:
+    """Run every list/pattern check once and return the hits the scoring helpers need.
+
+    Args:
+        text: item_text(item)
+        title: Lowercased title (regulator-in-title check)
+    """
+    regulatory_keyword = _REGULATORY_KEYWORDS_RE.search(text) is not None
+    central_bank = _CENTRAL_BANK_RE.search(text) is not None
+
+    financial_bonus = 0
+    for bonus, pattern in _FINANCIAL_TIERS:
+        if pattern.search(text):
+            financial_bonus = bonus
+            break
+
+    return {
+        "regulators": _count_tokens(REGULATORS, _REGULATORS_RE, text),
+        "tier1": _count_tokens(TIER1_INSTITUTIONS, _TIER1_RE, text),
+        "tier2": _count_tokens(TIER2_INSTITUTIONS, _TIER2_RE, text),
+        "financial_bonus": financial_bonus,
+        "regulatory_keyword": regulatory_keyword,
+        "regulator_in_title": regulatory_keyword and _REGULATORS_RE.search(title) is not None,
+        "central_bank_crypto": central_bank and _CB_CRYPTO_RE.search(text) is not None,
+    }
+
+
+def get_institution_bonus(hits: dict) -> int:
+    """Calculate bonus points for institutional sources, with multi-institution boost."""
     # Count distinct institution matches across all tiers
-    matched_count = 0
-    highest_tier_bonus = 0
-
-    # Check regulators (+30)
-    reg_matches = [reg for reg in REGULATORS if _token_in_text(reg, text)]
-    if reg_matches:
-        matched_count += len(reg_matches)
-        highest_tier_bonus = max(highest_tier_bonus, 30)
-
-    # Check tier 1 institutions (+20)
-    t1_matches = [inst for inst in TIER1_INSTITUTIONS if _token_in_text(inst, text)]
-    if t1_matches:
-        matched_count += len(t1_matches)
-        highest_tier_bonus = max(highest_tier_bonus, 20)
-
-    # Check tier 2 institutions (+10)
-    t2_matches = [inst for inst in TIER2_INSTITUTIONS if _token_in_text(inst, text)]
-    if t2_matches:
-        matched_count += len(t2_matches)
-        highest_tier_bonus = max(highest_tier_bonus, 10)
-
-    if highest_tier_bonus == 0:
+    matched_count = hits["regulators"] + hits["tier1"] + hits["tier2"]
+
+    # Regulators (+30) > tier 1 institutions (+20) > tier 2 institutions (+10)
+    if hits["regulators"]:
+        highest_tier_bonus = 30
+    elif hits["tier1"]:
+        highest_tier_bonus = 20
+    elif hits["tier2"]:
+        highest_tier_bonus = 10
+    else:
         return 0
 
     # Multi-institution bonus: +10 when 2+ distinct institutions mentioned
@@ -119,43 +181,23 @@ def get_institution_bonus(item: dict) -> int:
     return highest_tier_bonus + multi_bonus
 
 
-def get_financial_impact_bonus(item: dict) -> int:
-    """Calculate bonus for significant financial amounts."""
-    text = f"{item.get('title','')} {item.get('snippet','')}".lower()
-
-    for pattern, bonus in FINANCIAL_PATTERNS:
-        if re.search(pattern, text):
-            return bonus
-
-    return 0
-
-
-def get_regulatory_bonus(item: dict) -> int:
+def get_regulatory_bonus(hits: dict) -> int:
     """Calculate bonus for regulatory/policy news."""
-    text = f"{item.get('title','')} {item.get('snippet','')}".lower()
-    title = item.get('title', '').lower()
-
     # Regulator in title + regulatory keyword = +40 (critical regulatory action)
-    if _any_token_in_text(REGULATORS, title):
-        if any(kw in text for kw in REGULATORY_KEYWORDS):
-            return 40
+    if hits["regulator_in_title"]:
+        return 40
 
     # Just regulatory keywords in text = +15
-    if any(kw in text for kw in REGULATORY_KEYWORDS):
+    if hits["regulatory_keyword"]:
         return 15
 
     return 0
 
 
-def get_commentary_penalty(item: dict, comm_count: int) -> int:
+def get_commentary_penalty(hits: dict, comm_count: int) -> int:
     """Calculate commentary penalty (reduced for institutional sources)."""
-    text = f"{item.get('title','')} {item.get('snippet','')}".lower()
-
     # Check if from major institution or regulator
-    has_institution = (
-        _any_token_in_text(TIER1_INSTITUTIONS, text) or
-        _any_token_in_text(REGULATORS, text)
-    )
+    has_institution = hits["tier1"] > 0 or hits["regulators"] > 0
 
     if has_institution:
         # Institutional commentary is valuable (-10 per keyword, max -30)
@@ -167,7 +209,8 @@ def get_commentary_penalty(item: dict, comm_count: int) -> int:
 
 def score_item_improved(item: dict, now_utc: datetime,
                        tier1_count: int, tier2_count: int, comm_count: int,
-                       listicle_count: int, generic_count: int) -> dict:
+                       listicle_count: int, generic_count: int,
+                       text: str = None, published_epoch: float = None) -> dict:
     """
     Enhanced scoring with institution weighting and financial impact.
 
@@ -179,22 +222,29 @@ def score_item_improved(item: dict, now_utc: datetime,
         comm_count: Count of commentary patterns
         listicle_count: Count of listicle patterns
         generic_count: Count of generic patterns
+        text: Precomputed item_text(item); built here if not given
+        published_epoch: Precomputed published_at as epoch seconds; parsed here if not given
 
     Returns:
         Item dict with 'score' and 'score_breakdown' fields added
     """
     source_type = item.get('source_type', '')
+    if text is None:
+        text = item_text(item)
 
     # Base launch score (same as before)
     launch_score = min(tier1_count * 25, 60) + min(tier2_count * 10, 30)
 
+    # One pass over the text for every institution/regulatory/financial check
+    hits = _scan(text, item.get('title', '').lower())
+
     # NEW: Context-aware bonuses
-    institution_bonus = get_institution_bonus(item)
-    financial_bonus = get_financial_impact_bonus(item)
-    regulatory_bonus = get_regulatory_bonus(item)
+    institution_bonus = get_institution_bonus(hits)
+    financial_bonus = hits["financial_bonus"]
+    regulatory_bonus = get_regulatory_bonus(hits)
 
     # Commentary penalty (reduced for institutional sources)
-    commentary_penalty = get_commentary_penalty(item, comm_count)
+    commentary_penalty = get_commentary_penalty(hits, comm_count)
 
     # Quality penalties (unchanged)
     listicle_penalty = -min(listicle_count * 100, 200)
@@ -209,9 +259,11 @@ def score_item_improved(item: dict, now_utc: datetime,
     # Freshness (unchanged)
     freshness = 0
     try:
-        if item.get("published_at"):
+        if published_epoch is None and item.get("published_at"):
             dt = datetime.fromisoformat(item["published_at"].replace("Z", "+00:00"))
-            hours = (now_utc - dt).total_seconds() / 3600
+            published_epoch = dt.timestamp()
+        if published_epoch is not None:
+            hours = (now_utc.timestamp() - published_epoch) / 3600
             if hours <= 6:
                 freshness = 10
             elif hours <= 24:
@@ -242,10 +294,7 @@ def score_item_improved(item: dict, now_utc: datetime,
         score = max(score, 45)
 
     # 4. Central bank + stablecoin/tokenized = minimum 50 points
-    text = f"{item.get('title','')} {item.get('snippet','')}".lower()
-    has_central_bank = any(cb in text for cb in ["central bank", "monetary authority"])
-    has_crypto = any(kw in text for kw in ["stablecoin", "tokenized", "tokenization", "cbdc"])
-    if has_central_bank and has_crypto:
+    if hits["central_bank_crypto"]:
         score = max(score, 50)
 
     # Hard rejects (unchanged)
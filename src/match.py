@@ -2,6 +2,12 @@ from typing import List, Dict, Any
 import re
 
 
+# A keyword made only of word chars matches r"\bkw\b" exactly when it equals
+# one of the text's maximal \w+ runs, so one findall() over the text answers
+# all such keywords by set lookup; anything else (e.g. "on-ramp") keeps a regex.
+_WORD_RE = re.compile(r"\w+")
+
+
 def _build_patterns(keywords: List[str]):
     phrases = []
     word_pats = []
@@ -12,49 +18,71 @@ def _build_patterns(keywords: List[str]):
         if " " in k:
             phrases.append((kw, k.casefold()))
         else:
-            word_pats.append((kw, re.compile(rf"\b{re.escape(k.casefold())}\b")))
+            folded = k.casefold()
+            if _WORD_RE.fullmatch(folded):
+                word_pats.append((kw, folded, None))
+            else:
+                word_pats.append((kw, folded, re.compile(rf"\b{re.escape(folded)}\b")))
     return phrases, word_pats
 
 
-def _match_keywords(text: str, phrases, word_pats) -> List[str]:
-    t = (text or "").casefold()
+def _match_keywords(t: str, phrases, word_pats) -> List[str]:
+    """Keyword hits in t, which must already be casefolded."""
+    words = set(_WORD_RE.findall(t))
     hits = []
     for orig, folded in phrases:
         if folded in t:
             hits.append(orig)
-    for orig, pat in word_pats:
-        if pat.search(t):
+    for orig, folded, pat in word_pats:
+        if (folded in words) if pat is None else pat.search(t):
             hits.append(orig)
     # dedupe preserve order
-    seen = set()
-    out = []
-    for h in hits:
-        if h not in seen:
-            seen.add(h)
-            out.append(h)
-    return out
+    return list(dict.fromkeys(hits))
 
 
-def match_item(item: Dict[str, Any], keywords: List[str], topics: List[Dict[str, Any]]) -> Dict[str, Any]:
-    title = item.get("title") or ""
-    snippet = item.get("snippet") or ""
-    blob = f"{title}\n{snippet}"
+def build_matcher(keywords: List[str], topics: List[Dict[str, Any]]):
+    """Compile keyword patterns and casefold topic terms once per run.
 
+    Returns (phrases, word_pats, topic_terms) for match_item(..., matcher=...).
+    """
     phrases, word_pats = _build_patterns(keywords)
-    matched_kw = _match_keywords(blob, phrases, word_pats)
-
-    matched_topics = []
-    blob_folded = blob.casefold()
+    # Frozen for the run: every item reads these, nothing mutates them
+    phrases, word_pats = tuple(phrases), tuple(word_pats)
+    topic_terms = []
     for t in topics or []:
         name = t.get("name")
         any_terms = t.get("any", [])
         if not name or not any_terms:
             continue
-        for term in any_terms:
-            if (term or "").casefold() in blob_folded:
+        # Folded once here; duplicates after folding ("USDC"/"usdc") are checked once
+        terms = tuple(dict.fromkeys((term or "").casefold() for term in any_terms))
+        topic_terms.append((name, terms))
+    return phrases, word_pats, tuple(topic_terms)
+
+
+def match_item(
+    item: Dict[str, Any],
+    keywords: List[str],
+    topics: List[Dict[str, Any]],
+    matcher=None,
+) -> Dict[str, Any]:
+    title = item.get("title") or ""
+    snippet = item.get("snippet") or ""
+    blob = f"{title}\n{snippet}"
+
+    if matcher is None:
+        matcher = build_matcher(keywords, topics)
+    phrases, word_pats, topic_terms = matcher
+    blob_folded = blob.casefold()
+    matched_kw = _match_keywords(blob_folded, phrases, word_pats)
+
+    matched_topics = []
+    for name, terms in topic_terms:
+        for term in terms:
+            if term in blob_folded:
                 matched_topics.append(name)
                 break
 
     item["matched_keywords"] = matched_kw
     item["matched_topics"] = matched_topics
-    return item
\ No newline at end of file
+    return item
